@@ -1,6 +1,19 @@
+from functools import partial
+
 from django.contrib import admin
 from django.core.exceptions import ImproperlyConfigured
 
+# Inline classes already built for a given Lisan model, shared by all admin
+# instances so the class is only created once.
+_lisan_inline_cache = {}
+
+
+def _lisan_getter(obj, field_name):
+    """
+    Return the English value of a lisan field, used by the admin getters.
+    """
+    return obj.get_lisan_field(field_name, 'en')
+
 
 class LisanAdminMixin(admin.ModelAdmin):
     """
@@ -17,33 +30,59 @@ class LisanAdminMixin(admin.ModelAdmin):
         """
         Initialize the LisanAdminMixin.
 
-        If the model has `lisan_fields` defined, it generates getter methods
-        for each field to display localized content in the admin interface.
+        If the model has `lisan_fields` defined, it makes sure the getter
+        methods used to display localized content in the admin interface
+        are installed for this admin class.
         """
         super().__init__(*args, **kwargs)
-        if hasattr(self.model, 'lisan_fields'):
-            self._generate_lisan_getters()
+        if getattr(self.model, 'lisan_fields', None) is not None:
+            self._ensure_lisan_getters_installed()
+
+    def _ensure_lisan_getters_installed(self):
+        """
+        Install the lisan getters once per admin class.
 
-    def _generate_lisan_getters(self):
+        The getters only depend on the model, so they are generated on the
+        first instantiation and stored on the class. If the same admin class
+        is reused for another model, the getters are generated on the
+        instance instead so the models do not overwrite each other.
+        """
+        admin_class = type(self)
+        installed_for = admin_class.__dict__.get('_lisan_getters_model')
+
+        if installed_for is None:
+            self._generate_lisan_getters(admin_class)
+            admin_class._lisan_getters_model = self.model
+        elif installed_for is not self.model:
+            self._generate_lisan_getters(self)
+
+    def _generate_lisan_getters(self, target):
         """
         Dynamically generate getter methods for each field in `lisan_fields`.
 
         These methods retrieve the content in the default language (English)
         and add them to the `list_display` in the admin interface.
+
+        Args:
+            target: The admin class or instance the getters are set on.
         """
+        format_description = self.lisan_display_format.format
+        method_names = []
         for field_name in self.model.lisan_fields:
             method_name = f'get_lisan_{field_name}'
-            setattr(self, method_name, self._create_lisan_getter(field_name))
-
-            short_description = self.lisan_display_format.format(
+            getter = self._create_lisan_getter(field_name)
+            getter.short_description = format_description(
                 field_name=field_name.capitalize(), language_code='EN'
             )
-            getattr(self, method_name).short_description = short_description
+            setattr(target, method_name, getter)
+            method_names.append(method_name)
 
-            if 'list_display' in self.__dict__:
-                self.list_display += (method_name,)
-            else:
-                self.list_display = (method_name,)
+        if not method_names:
+            return
+
+        # The getters replace any `list_display` declared on the admin, as
+        # they always have; it is built in one go instead of once per field
+        target.list_display = tuple(method_names)
 
     def _create_lisan_getter(self, field_name):
         """
@@ -53,12 +92,10 @@ class LisanAdminMixin(admin.ModelAdmin):
             field_name (str): The name of the field to create the getter for.
 
         Returns:
-            function: A function that retrieves the localized content of the
-                      specified field in English.
+            functools.partial: A callable that retrieves the localized content
+                               of the specified field in English.
         """
-        def getter(obj):
-            return obj.get_lisan_field(field_name, 'en')
-        return getter
+        return partial(_lisan_getter, field_name=field_name)
 
     def get_lisan_inline(self):
         """
@@ -70,25 +107,25 @@ class LisanAdminMixin(admin.ModelAdmin):
         Returns:
             LisanInline: The inline class for managing translations.
         """
-        lisan_field = None
-        for field in self.model._meta.get_fields():
-            if field.is_relation and field.one_to_many and field.related_model:
-                # Verify it's a Lisan model
-                if hasattr(field.related_model, 'language_code'):
-                    lisan_field = field
-                    break
-
-        if not lisan_field:
+        # The Lisan model is attached to the model when it is generated,
+        # so there is no need to scan the model's relations for it
+        lisan_model = getattr(self.model, 'Lisan', None)
+        if lisan_model is None:
             raise ImproperlyConfigured(
                 f"{self.model.__name__} does not have a related Lisan model."
             )
 
-        lisan_model = lisan_field.related_model
+        # The inline only depends on the Lisan model, so it is keyed on it;
+        # a model whose Lisan model gets replaced never sees a stale inline
+        cached_inline = _lisan_inline_cache.get(lisan_model)
+        if cached_inline is not None:
+            return cached_inline
 
         class LisanInline(admin.TabularInline):
             model = lisan_model
             extra = 1
 
+        _lisan_inline_cache[lisan_model] = LisanInline
         return LisanInline
 
     def get_inlines(self, request, obj=None):
@@ -105,6 +142,12 @@ class LisanAdminMixin(admin.ModelAdmin):
         Returns:
             list: A list of inline classes to be displayed in the admin.
         """
+        cached_inlines = getattr(self, '_cached_inlines', None)
+        if cached_inlines is not None:
+            return list(cached_inlines)
+
         if getattr(self.model, 'lisan_fields', None):
-            return [self.get_lisan_inline()]
-        return []
+            self._cached_inlines = [self.get_lisan_inline()]
+        else:
+            self._cached_inlines = []
+        return list(self._cached_inlines)
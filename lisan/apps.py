@@ -22,8 +22,26 @@ class LisanConfig(AppConfig):
         `lisan_fields` defined, a corresponding Lisan model is created and
         associated with the original model via a ManyToManyField relationship.
         """
-        for model in apps.get_models():
-            if hasattr(model, 'lisan_fields'):
+        # `ready()` can be invoked more than once (e.g. by test runners);
+        # the Lisan models only need to be set up the first time.
+        if getattr(self, '_lisan_ready_done', False):
+            return
+        self._lisan_ready_done = True
+
+        # Only consider models declaring `lisan_fields` themselves, so
+        # subclasses inheriting the attribute are not processed twice
+        lisan_enabled_models = [
+            model for model in apps.get_models()
+            if model.__dict__.get('lisan_fields') is not None
+        ]
+
+        for model in lisan_enabled_models:
+            # Models using `LisanModelMixin` already got their Lisan model
+            # from `LisanModelMeta` when the class was created; reuse it
+            # instead of building (and registering) a second one
+            lisan_model = model.__dict__.get('Lisan')
+
+            if lisan_model is None:
                 # Extract the fields intended for multilingual support
                 lisan_fields = {
                     field: model._meta.get_field(field)
@@ -36,12 +54,12 @@ class LisanConfig(AppConfig):
                 # Set the Lisan model as an attribute of the original model
                 setattr(model, 'Lisan', lisan_model)
 
-                # Add a ManyToManyField to associate the model with its Lisan
-                model.add_to_class(
-                    'lisans',
-                    models.ManyToManyField(
-                        lisan_model,
-                        related_name=f"{model._meta.model_name}_lisans",
-                        db_table=f"{model._meta.db_table}_to_lisan"
-                    )
+            # Add a ManyToManyField to associate the model with its Lisan
+            model.add_to_class(
+                'lisans',
+                models.ManyToManyField(
+                    lisan_model,
+                    related_name=f"{model._meta.model_name}_lisans",
+                    db_table=f"{model._meta.db_table}_to_lisan"
                 )
+            )
@@ -1,8 +1,52 @@
+import uuid
+
 from django.db import models
+from django.db.models.options import Options
 from django.conf import settings
-from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
+# Lisan models already built, keyed by the original model, the names of the
+# translatable fields, the primary key type and the app registry the model
+# is registered in. Each entry also keeps the definitions of the fields so
+# that a call with different definitions builds a new model.
+_lisan_model_cache = {}
+
+
+def _get_field_definitions(fields):
+    """
+    Describe the translatable fields in a comparable form.
+
+    :param fields: A dictionary mapping field names to field instances.
+    :return: A list of (name, path, args, kwargs) tuples, sorted by name.
+    """
+    return [
+        (name, *field.deconstruct()[1:])
+        for name, field in sorted(fields.items())
+    ]
+
+
+def _build_primary_key_field(primary_key_type):
+    """
+    Build the primary key field of a Lisan model.
+
+    Args:
+        primary_key_type (Field): The field class to use as primary key.
+
+    Returns:
+        Field: The primary key field instance.
+    """
+    if primary_key_type is models.UUIDField:
+        # Configure UUIDField with auto-generation
+        return models.UUIDField(
+            primary_key=True,
+            default=uuid.uuid4,
+            editable=False,
+            verbose_name=_("id")
+        )
+
+    # Default primary key field setup
+    return primary_key_type(primary_key=True)
+
 
 def create_lisan_model(
         model_cls, fields, primary_key_type=models.BigAutoField):
@@ -19,22 +63,51 @@ def create_lisan_model(
                        model.
 
     Returns:
-        Model: The dynamically created Lisan model class.
+        Model: The dynamically created Lisan model class. Calling this
+               function again with the same arguments returns the same
+               class instead of registering a new one.
     """
+    # Generated models are registered in the default registry, which
+    # isolated test registries replace
+    cache_key = (
+        model_cls, tuple(sorted(fields)), primary_key_type,
+        Options.default_apps)
+    field_definitions = _get_field_definitions(fields)
+    cached = _lisan_model_cache.get(cache_key)
+    if cached is not None and cached[0] == field_definitions:
+        return cached[1]
+
+    # Read the options of the original model once
+    meta = model_cls._meta
+    model_name = meta.model_name
+    model_verbose_name = meta.verbose_name
+
     # Define metadata for the dynamically created Lisan model
     class Meta:
-        app_label = model_cls._meta.app_label
+        app_label = meta.app_label
+        # Changing these fields, or the ForeignKey below, changes the schema
+        # of every generated model and requires migrations downstream
         constraints = [
             models.UniqueConstraint(
-                fields=['language_code', model_cls._meta.model_name],
-                name=f'unique_language_{model_cls._meta.verbose_name}'
+                fields=['language_code', model_name],
+                name=f'unique_language_{model_verbose_name}'
             )
         ]
-        db_table = f"{model_cls._meta.db_table}_lisan"
-        verbose_name = f"{model_cls._meta.verbose_name} lisan"
-        verbose_name_plural = f"{model_cls._meta.verbose_name_plural} lisans"
+        db_table = f"{meta.db_table}_lisan"
+        verbose_name = f"{model_verbose_name} lisan"
+        verbose_name_plural = f"{meta.verbose_name_plural} lisans"
+
+    # The default type needs no validation; anything else must be a
+    # Field subclass (and a class at all, so issubclass does not fail)
+    if primary_key_type is not models.BigAutoField and not (
+            isinstance(primary_key_type, type) and
+            issubclass(primary_key_type, models.Field)):
+        raise TypeError(
+            "Invalid primary_key_type provided. Must be a subclass of models.Field.") # noqa
 
-    # Build the attributes for the Lisan model
+    # Build the attributes for the Lisan model in a single pass: the
+    # language code, the primary key, the translatable fields and a
+    # ForeignKey linking the Lisan model to the original model
     attrs = {
         'Meta': Meta,
         '__module__': model_cls.__module__,
@@ -42,46 +115,15 @@ def create_lisan_model(
             max_length=10,
             verbose_name=_("language code")
         ),
+        'id': _build_primary_key_field(primary_key_type),
+        **fields,
+        model_name: models.ForeignKey(
+            model_cls,
+            related_name=f"{model_name}_lisans",
+            on_delete=models.CASCADE
+        ),
     }
 
-    if not issubclass(primary_key_type, models.Field):
-        raise TypeError(
-            "Invalid primary_key_type provided. Must be a subclass of models.Field.") # noqa
-
-    if primary_key_type is models.UUIDField:
-        import uuid
-        # Configure UUIDField with auto-generation
-        attrs['id'] = models.UUIDField(
-            primary_key=True,
-            default=uuid.uuid4,
-            editable=False,
-            verbose_name=_("id")
-        )
-    else:
-        # Default primary key field setup
-        attrs['id'] = primary_key_type(primary_key=True)
-
-    # Add the specified fields to the Lisan model
-    for field_name, field in fields.items():
-        attrs[field_name] = field
-
-    def clean(self):
-        if self.__class__.objects.filter(
-            language_code=self.language_code,
-            **{f"{model_cls._meta.model_name}_id": getattr(
-                self, f"{model_cls._meta.model_name}_id")}
-        ).exists():
-            raise ValidationError("Duplicate translation for this language.")
-
-    attrs['clean'] = clean
-
-    # Create a ForeignKey field linking the Lisan model to the original model
-    attrs[model_cls._meta.model_name] = models.ForeignKey(
-        model_cls,
-        related_name=f"{model_cls._meta.model_name}_lisans",
-        on_delete=models.CASCADE
-    )
-
     # Dynamically create the Lisan model class
     lisan_model = type(
         f'{model_cls.__name__}LisanModel',
@@ -89,6 +131,15 @@ def create_lisan_model(
         attrs
     )
 
+    # Names accepted when setting translations, checked with a single set
+    # operation instead of reflecting on the model for every field
+    lisan_model._lisan_field_names = frozenset(
+        name
+        for field in lisan_model._meta.fields
+        for name in (field.name, field.attname)
+    )
+
+    _lisan_model_cache[cache_key] = (field_definitions, lisan_model)
     return lisan_model
 
 
@@ -118,7 +169,9 @@ class LisanModelMeta(models.base.ModelBase):
         Returns:
             Model: The newly created model class with multilingual support.
         """
-        if 'LisanModelMixin' in [base.__name__ for base in bases]:
+        # The mixin cannot be imported here (it is built with this
+        # metaclass), so match it by name without building a list
+        if any(base.__name__ == 'LisanModelMixin' for base in bases):
             lisan_fields = attrs.get('lisan_fields')
 
             # If `lisan_fields` is not defined, raise an exception
@@ -127,16 +180,20 @@ class LisanModelMeta(models.base.ModelBase):
                     f"{name} must define 'lisan_fields' when using LisanModelMixin."  # noqa
                 )
 
-            if not all(field in attrs for field in lisan_fields):
-                raise ValueError(
-                    f"Invalid 'lisan_fields' in {name}. Ensure all fields are defined.")  # noqa
-
-            # Filter translatable fields by checking if they are
-            # defined in lisan_fields
-            translatable_fields = {
-                key: value for key, value in attrs.items()
-                if isinstance(value, models.Field) and key in lisan_fields
-            }
+            # Collect the translatable fields by looking up each entry of
+            # lisan_fields, validating that they are all defined fields
+            translatable_fields = {}
+            for field_name in lisan_fields:
+                field = attrs.get(field_name)
+                if not isinstance(field, models.Field):
+                    raise ValueError(
+                        f"Invalid 'lisan_fields' in {name}. Ensure all fields are defined.")  # noqa
+                translatable_fields[field_name] = field
+
+            # Freeze the translatable field names, keeping their order for
+            # iteration and a set for membership tests
+            attrs['lisan_fields'] = tuple(lisan_fields)
+            attrs['_lisan_fields_set'] = frozenset(lisan_fields)
 
             # Determine primary key type, checking model-specific
             # setting first, then global
@@ -1,5 +1,103 @@
+import re
+from functools import lru_cache
+
 from django.utils.deprecation import MiddlewareMixin
-from django.conf import settings
+
+from lisan.utils import get_lisan_settings
+
+# Matches a valid quality value, from 0 to 1 with at most three decimals
+_QUALITY_RE = re.compile(r'(?:0(?:\.[0-9]{0,3})?|1(?:\.0{0,3})?)')
+
+
+def _parse_quality(parameters):
+    """
+    Return the quality value of an 'Accept-Language' entry.
+
+    :param parameters: The parameters following the language tag, such as
+                       ['q=0.8'].
+    :return: The quality value, 1.0 if none is given, or None if it cannot
+             be parsed.
+    """
+    for parameter in parameters:
+        name, _, value = parameter.partition('=')
+        # Parameter names are case-insensitive, so 'Q=0.5' is a quality
+        if name.strip().lower() == 'q':
+            value = value.strip()
+            if _QUALITY_RE.fullmatch(value) is None:
+                return None
+            return float(value)
+    return 1.0
+
+
+@lru_cache(maxsize=1024)
+def _parse_accept_language_tags(accept_language_header):
+    """
+    Extract the language tags of an 'Accept-Language' header, by preference.
+
+    Headers repeat a lot between requests, so the results are cached.
+
+    Args:
+        accept_language_header: The value of the 'Accept-Language' header.
+
+    Returns:
+        A tuple of the language tags, ordered by decreasing quality value
+        and then by position. Tags with a quality value of zero, or with a
+        quality value that cannot be parsed, are left out. Empty or
+        malformed headers give an empty tuple.
+    """
+    if not accept_language_header:
+        return ()
+
+    # A bare tag such as 'am' needs neither parsing nor sorting
+    if ',' not in accept_language_header and ';' not in accept_language_header:
+        return tuple(accept_language_header.split(None, 1)[:1])
+
+    weighted_tags = []
+    for entry in accept_language_header.split(','):
+        language_tag, *parameters = entry.split(';')
+        language_tag = language_tag.strip()
+        if not language_tag:
+            continue
+        quality = _parse_quality(parameters)
+        if quality:
+            weighted_tags.append((quality, language_tag))
+
+    # sorted() is stable, so equal quality values keep the header order
+    weighted_tags = sorted(
+        weighted_tags, key=lambda weighted_tag: weighted_tag[0], reverse=True)
+    return tuple(language_tag for _, language_tag in weighted_tags)
+
+
+@lru_cache(maxsize=16)
+def _get_language_lookup(allowed_languages):
+    """
+    Map the lowercased allowed language codes to the configured ones.
+
+    Language tags are case-insensitive, so header tags are matched on their
+    lowercased form and resolved to the code as configured.
+
+    :param allowed_languages: The tuple of allowed language codes.
+    :return: A dictionary mapping lowercased codes to configured codes.
+    """
+    return {
+        language_code.lower(): language_code
+        for language_code in reversed(allowed_languages)
+    }
+
+
+def _parse_accept_language(accept_language_header):
+    """
+    Extract the preferred language code of an 'Accept-Language' header.
+
+    Args:
+        accept_language_header: The value of the 'Accept-Language' header.
+
+    Returns:
+        The preferred language code, or None if the header is empty or
+        malformed.
+    """
+    language_tags = _parse_accept_language_tags(accept_language_header)
+    return language_tags[0] if language_tags else None
 
 
 class LanguageMiddleware(MiddlewareMixin):
@@ -16,48 +114,78 @@ class LanguageMiddleware(MiddlewareMixin):
         """
         Process the incoming request to set the language code.
 
-        This method extracts the 'Accept-Language' header from the request
-        headers and assigns it to `request.language_code`. If the header is
-        not present, the language code defaults to the value specified by
-        the `LISAN_DEFAULT_LANGUAGE` setting, or 'en' if that setting is
-        not configured.
+        The language code is taken from the first source that provides one,
+        in order of precedence: the `lang` query parameter, the user's
+        profile preference, the `language` cookie and the 'Accept-Language'
+        header. If that language is not supported, the language code
+        defaults to the value specified by the `LISAN_DEFAULT_LANGUAGE`
+        setting, or 'en' if that setting is not configured.
 
         Args:
             request: The HTTP request object.
         """
-        # Fetch the default language from settings, fallback to 'en'
-        default_language = getattr(settings, 'LISAN_DEFAULT_LANGUAGE', 'en')
-        supported_language = getattr(
-            settings, 'LISAN_ALLOWED_LANGUAGES', [default_language])
-
-        # Safe retrieval of user profile language preference
-        language_preference = None
-        if hasattr(request, 'user') and hasattr(
-                request.user, 'profile') and hasattr(
-                    request.user.profile, 'language_preference'):
-            language_preference = request.user.profile.language_preference
-
-        # Extract the language code in order of precedence
+        # Cached, and refreshed when the LISAN_* settings change
+        lisan_settings = get_lisan_settings()
+        supported_languages = lisan_settings.allowed_language_set
+
+        # The sources are only evaluated until one provides a language, so
+        # a lazy `request.user` is not resolved when `lang` is given
         language_code = (
             request.GET.get('lang') or
-            language_preference or
+            self._get_profile_language(request) or
             request.COOKIES.get('language') or
-            self.parse_accept_language(
-                request.headers.get('Accept-Language')) or
-            default_language
+            self._get_accept_language(
+                request.headers.get('Accept-Language'),
+                lisan_settings.allowed_languages)
         )
 
         # Validate against supported languages
-        if language_code not in supported_language:
-            language_code = default_language
+        if language_code not in supported_languages:
+            language_code = lisan_settings.default_language
 
-        # Set the language code on the request object
         request.language_code = language_code
 
+    def _get_profile_language(self, request):
+        """
+        Return the language preference of the user's profile, if any.
+
+        :param request: The HTTP request object.
+        :return: The preferred language code, or None.
+        """
+        user = getattr(request, 'user', None)
+        profile = getattr(user, 'profile', None)
+        return getattr(profile, 'language_preference', None)
+
+    def _get_accept_language(self, accept_language_header, allowed_languages):
+        """
+        Return the most preferred allowed language of the header.
+
+        Tags are compared case-insensitively. A tag that is not allowed,
+        such as 'en-US', falls back to its primary subtag, 'en'.
+
+        :param accept_language_header: The value of the 'Accept-Language'
+                                       header.
+        :param allowed_languages: The tuple of allowed language codes.
+        :return: The allowed language code as configured, or None if the
+                 header provides no allowed language.
+        """
+        language_lookup = _get_language_lookup(allowed_languages)
+        for language_tag in _parse_accept_language_tags(
+                accept_language_header):
+            language_tag = language_tag.lower()
+            language_code = language_lookup.get(language_tag)
+            if language_code is None:
+                language_code = language_lookup.get(
+                    language_tag.partition('-')[0])
+            if language_code is not None:
+                return language_code
+        return None
+
     def parse_accept_language(self, accept_language_header):
         """
-        Parse the 'Accept-Language' header and extract the first language code.
-        If the header is malformed or empty, return None.
+        Parse the 'Accept-Language' header and extract the preferred
+        language code, honouring quality values. If the header is malformed
+        or empty, return None.
 
         Args:
             accept_language_header: The value of the 'Accept-Language' header.
@@ -66,13 +194,4 @@ class LanguageMiddleware(MiddlewareMixin):
             A string representing the best matched language code, or None
             if not found.
         """
-        if not accept_language_header:
-            return None
-
-        # Split on commas and take the first part before any semicolon
-        languages = accept_language_header.split(',')
-        if languages:
-            primary_language = languages[0].split(';')[0].strip()
-            return primary_language if primary_language else None
-
-        return None
+        return _parse_accept_language(accept_language_header)
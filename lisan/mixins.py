@@ -1,8 +1,11 @@
-from django.conf import settings
-from django.db import models, IntegrityError, transaction
-from django.core.exceptions import ObjectDoesNotExist, FieldDoesNotExist
+from contextlib import nullcontext
+
+from django.db import (
+    connections, models, router, IntegrityError, transaction)
+from django.db.models import Case, IntegerField, Prefetch, When
+from django.core.exceptions import FieldDoesNotExist
 from lisan.metaclasses import LisanModelMeta
-from lisan.utils import get_translation_service
+from lisan.utils import get_lisan_settings, get_translation_service
 
 
 class LisanModelMixin(models.Model, metaclass=LisanModelMeta):
@@ -16,33 +19,84 @@ class LisanModelMixin(models.Model, metaclass=LisanModelMeta):
 
     _current_language = 'en'
 
+    # Attribute holding the translations loaded by `get_lisan_prefetch`
+    _lisan_prefetch_attr = '_prefetched_lisans'
+
     class Meta:
         abstract = True
 
-    def get_lisan(self, language_code=None):
+    @classmethod
+    def get_lisan_prefetch(cls, queryset=None):
+        """
+        Build a `Prefetch` loading the translations of many instances at once.
+
+        Use it with `prefetch_related` so that `get_lisan` reads the
+        translations from memory instead of querying once per instance.
+
+        Args:
+            queryset (QuerySet, optional): A queryset of the Lisan model to
+                                           prefetch from. Defaults to all
+                                           translations.
+
+        Returns:
+            Prefetch: The prefetch object for the translations.
+
+        Example:
+            >>> Snippet.objects.prefetch_related(
+            ...     Snippet.get_lisan_prefetch())
+        """
+        return Prefetch(
+            f"{cls._meta.model_name}_lisans",
+            queryset=queryset,
+            to_attr=cls._lisan_prefetch_attr
+        )
+
+    def get_lisan(self, language_code=None, fields=None):
         """
         Retrieve the Lisan (translation) instance for the specified language.
 
+        If the translations were loaded with `get_lisan_prefetch`, they are
+        looked up in memory without querying the database. Otherwise the
+        result is cached on the instance, so asking again for the same
+        language does not query the database either.
+
         Args:
             language_code (str): The language code to retrieve the translation
                                  for. Defaults to the current language.
+            fields (iterable, optional): Only load these fields of the
+                                         translation when it has to be
+                                         queried. Such partial rows are not
+                                         cached on the instance.
 
         Returns:
             Model or None: The Lisan model instance for the specified language,
                            or None if not found.
         """
         language_code = language_code or self._current_language
-        try:
-            filter_kwargs = {
-                    "language_code": language_code,
-                    f"{self._meta.model_name}": self
-                }
-            return self.Lisan.objects.filter(**filter_kwargs).first()
-        except ObjectDoesNotExist:
-            return None
-        except Exception as e:
-            # Log or handle unexpected exceptions if needed
-            raise e
+
+        prefetched_lisans = self.__dict__.get(self._lisan_prefetch_attr)
+        if prefetched_lisans is not None:
+            return next(
+                (lisan for lisan in prefetched_lisans
+                 if lisan.language_code == language_code),
+                None
+            )
+
+        lisan_cache = self._get_lisan_cache()
+        if language_code in lisan_cache:
+            return lisan_cache[language_code]
+
+        # first() returns None for a missing translation, so there is no
+        # DoesNotExist to catch; unexpected errors propagate to the caller
+        queryset = self.Lisan.objects.filter(
+            language_code=language_code, **{self._meta.model_name: self})
+        if fields is not None:
+            return queryset.only('language_code', *fields).first()
+        lisan = queryset.first()
+
+        # Remember missing translations too, so they are not queried again
+        lisan_cache[language_code] = lisan
+        return lisan
 
     def set_lisan(self, language_code, **lisan_fields):
         """
@@ -56,6 +110,12 @@ class LisanModelMixin(models.Model, metaclass=LisanModelMeta):
         Returns:
             Model: The updated or created Lisan model instance.
 
+        Behavior:
+            On databases supporting upserts, the translation is written with
+            a single `INSERT ... ON CONFLICT` statement and then read back.
+            Otherwise it is looked up, then inserted or updated. A primary
+            key value is only used when the translation is created.
+
         Raises:
             ValueError: If no language code is provided.
             FieldDoesNotExist: If a specified field does not exist in the
@@ -63,110 +123,208 @@ class LisanModelMixin(models.Model, metaclass=LisanModelMeta):
             IntegrityError: If a database integrity issue occurs.
         """
         self._validate_language_code(language_code)
+        self._clear_lisan_cache(language_code)
+
+        self._check_lisan_fields(lisan_fields.keys())
 
+        db = router.db_for_write(self.Lisan, instance=self)
         try:
-            with transaction.atomic():
-                filter_kwargs = {
-                    "language_code": language_code,
-                    f"{self._meta.model_name}": self
-                }
-                lisan = self.Lisan.objects.filter(**filter_kwargs).first()
-
-                if not lisan:
-                    # Check if all lisan_fields exist in the model
-                    for field_name in lisan_fields.keys():
-                        if not hasattr(self.Lisan, field_name):
-                            raise FieldDoesNotExist(
-                                f"Field '{field_name}' does not exist in the "
-                                "translation model."
-                            )
-
-                    primary_key_field = getattr(self.Lisan._meta, 'pk', None)
-                    if primary_key_field and primary_key_field.name != 'id':
-                        primary_key_value = lisan_fields.pop(
-                            primary_key_field.name, None)
-                    else:
-                        primary_key_value = None
-
-                    # Explicitly set the foreign key to self (the instance)
-                    # TODO: this is not capturing the UUID for the id
-                    lisan = self.Lisan(
-                        **lisan_fields,
-                        language_code=language_code,
-                        **{self._meta.model_name: self}
-                    )
-
-                    if primary_key_value is not None:
-                        setattr(
-                            lisan,
-                            primary_key_field.name,
-                            primary_key_value
-                        )
-
-                    lisan.save()
-                else:
-                    for field, value in lisan_fields.items():
-                        if hasattr(lisan, field):
-                            setattr(lisan, field, value)
-                        else:
-                            raise FieldDoesNotExist(
-                                f"Field '{field}' does not exist in the "
-                                "translation model."
-                            )
-                    lisan.save()
-                return lisan
+            if connections[db].features.supports_update_conflicts:
+                self._upsert_lisans({language_code: lisan_fields}, db)
+                lisan = None
+            else:
+                lisan = self._select_and_write_lisans(
+                    {language_code: lisan_fields}, db)[language_code]
         except IntegrityError:
             raise IntegrityError(
                 "Failed to set translation due to database integrity issues."
             )
-        except FieldDoesNotExist as e:
-            raise e
-        except Exception as e:
-            raise e
+
+        # The upserted row may be an existing one, whose primary key and
+        # untouched fields are only known to the database, and bulk_create
+        # cannot return generated primary keys on every backend
+        if lisan is None or lisan.pk is None:
+            lisan = self.Lisan.objects.using(db).get(
+                language_code=language_code,
+                **{self._meta.model_name: self}
+            )
+
+        self._get_lisan_cache()[language_code] = lisan
+        return lisan
 
     def set_bulk_lisans(self, translations):
         """
         Set or update translations for multiple languages in bulk.
 
         Args:
-            translations (dict): A dictionary where each key is a language
-                                code (str) and the corresponding value is a
-                                dictionary of fields (dict) to be set or
-                                updated for that language.
+            translations (list): A list of dictionaries, each holding a
+                                 `language_code` and the fields (dict) to be
+                                 set or updated for that language.
 
                                 Example:
-                                {
-                                    'en': {
+                                [
+                                    {
+                                        'language_code': 'en',
                                         'field1': 'value1',
                                         'field2': 'value2'
                                     },
-                                    'fr': {
+                                    {
+                                        'language_code': 'fr',
                                         'field1': 'valeur1',
                                         'field2': 'valeur2'
                                     }
-                                }
+                                ]
 
         Behavior:
-            This method updates the Lisan (translation) model for each
-            specified language in bulk. For each language code in the
-            `translations` dictionary, the corresponding fields
-            and their values are passed to the `set_lisan` method for
-            that language.
+            On databases supporting upserts, the translations are inserted
+            or updated with one `INSERT ... ON CONFLICT` statement per set
+            of fields being written, usually a single one, regardless of
+            the number of languages. Otherwise the existing translations
+            are fetched with a single query, then written with one
+            `bulk_create` and one `bulk_update`.
 
         Transaction:
-            The operation is wrapped in a database transaction to ensure
-            that either all translations are successfully updated or none
-            of them are (atomic operation).
+            The writes are atomic: either all translations are successfully
+            saved or none of them are. A transaction is only opened when
+            several statements are needed, since each bulk operation is
+            already atomic on its own.
 
         Raises:
-            Exception: Any exceptions encountered during the transaction
-            will cause the entire operation to roll back, ensuring data
-            consistency.
+            ValueError: If a language code is missing or unsupported.
+            FieldDoesNotExist: If a specified field does not exist in the
+                               translation model.
+        """
+        # Merge the entries per language without mutating the input
+        fields_by_language = {}
+        for translation in translations:
+            lisan_fields = dict(translation)
+            language_code = lisan_fields.pop('language_code', None)
+            self._validate_language_code(language_code)
+            self._check_lisan_fields(lisan_fields.keys())
+            fields_by_language.setdefault(
+                language_code, {}).update(lisan_fields)
+
+        if not fields_by_language:
+            return
+
+        db = router.db_for_write(self.Lisan, instance=self)
+        if connections[db].features.supports_update_conflicts:
+            self._upsert_lisans(fields_by_language, db)
+        else:
+            self._select_and_write_lisans(fields_by_language, db)
+
+        self._clear_lisan_cache()
+
+    def _upsert_lisans(self, fields_by_language, db):
         """
-        with transaction.atomic():
-            for translation in translations:
-                language_code = translation.pop("language_code")
-                self.set_lisan(language_code, **translation)
+        Insert or update translations with `INSERT ... ON CONFLICT`.
+
+        Rows setting the same fields are written with a single statement;
+        each group only overwrites its own fields on conflict, so fields
+        left out of a translation keep their stored value.
+
+        :param fields_by_language: The fields to set, keyed by language.
+        :param db: The alias of the database to write to.
+        """
+        model_name = self._meta.model_name
+        rows_by_fields = {}
+        for language_code, lisan_fields in fields_by_language.items():
+            rows_by_fields.setdefault(frozenset(lisan_fields), []).append(
+                self.Lisan(
+                    **lisan_fields,
+                    language_code=language_code,
+                    **{model_name: self}
+                )
+            )
+
+        if connections[db].features.supports_update_conflicts_with_target:
+            unique_fields = [model_name, 'language_code']
+        else:
+            unique_fields = None
+
+        # A primary key value is only used when creating the translation
+        primary_key_names = self._get_lisan_primary_key_names()
+
+        # Each statement is atomic on its own, so a transaction (or
+        # savepoint) is only needed when several are issued
+        with transaction.atomic(using=db) if len(rows_by_fields) > 1 \
+                else nullcontext():
+            for field_names, rows in rows_by_fields.items():
+                update_fields = field_names - primary_key_names
+                if not update_fields:
+                    # Nothing to update, only create missing translations
+                    self.Lisan.objects.using(db).bulk_create(
+                        rows, batch_size=500, ignore_conflicts=True)
+                    continue
+                self.Lisan.objects.using(db).bulk_create(
+                    rows,
+                    batch_size=500,
+                    update_conflicts=True,
+                    unique_fields=unique_fields,
+                    update_fields=list(update_fields)
+                )
+
+    def _select_and_write_lisans(self, fields_by_language, db):
+        """
+        Insert or update translations on backends without upserts.
+
+        The existing translations are fetched with a single query, then
+        missing languages are inserted with one `bulk_create` and existing
+        ones are saved with one `bulk_update`.
+
+        :param fields_by_language: The fields to set, keyed by language.
+        :param db: The alias of the database to read from and write to.
+        :return: A dictionary mapping the language codes to the written
+                 Lisan instances.
+        """
+        model_name = self._meta.model_name
+        # A primary key value is only used when creating the translation
+        primary_key_names = self._get_lisan_primary_key_names()
+        # The lookup goes to the database written to, not a read replica
+        lisan_manager = self.Lisan.objects.db_manager(db)
+        existing_lisans = {
+            lisan.language_code: lisan
+            for lisan in lisan_manager.filter(
+                language_code__in=list(fields_by_language),
+                **{model_name: self}
+            )
+        }
+
+        to_create = []
+        to_update = []
+        updated_fields = set()
+        written_lisans = {}
+        for language_code, lisan_fields in fields_by_language.items():
+            lisan = existing_lisans.get(language_code)
+            if lisan is None:
+                lisan = self.Lisan(
+                    **lisan_fields,
+                    language_code=language_code,
+                    **{model_name: self}
+                )
+                to_create.append(lisan)
+            else:
+                lisan_fields = {
+                    field: value for field, value in lisan_fields.items()
+                    if field not in primary_key_names
+                }
+                if lisan_fields:
+                    for field, value in lisan_fields.items():
+                        setattr(lisan, field, value)
+                    to_update.append(lisan)
+                    updated_fields.update(lisan_fields)
+            written_lisans[language_code] = lisan
+
+        # bulk_create and bulk_update are atomic on their own, so a
+        # transaction (or savepoint) is only needed when both are issued
+        with transaction.atomic(using=db) if to_create and to_update \
+                else nullcontext():
+            if to_create:
+                lisan_manager.bulk_create(to_create, batch_size=500)
+            if to_update:
+                lisan_manager.bulk_update(
+                    to_update, fields=list(updated_fields), batch_size=500)
+        return written_lisans
 
     def get_lisan_field(
             self, field_name,
@@ -204,14 +362,12 @@ class LisanModelMixin(models.Model, metaclass=LisanModelMeta):
                             its translations.
         """
         language_code = language_code or self._current_language
-        fallback_languages = fallback_languages or getattr(
-            settings, 'LISAN_FALLBACK_LANGUAGES', ['en']
-        )
-        # Try to get the field from available translations
-        for lang in [language_code] + fallback_languages:
-            lisan = self.get_lisan(lang)
-            if lisan and hasattr(lisan, field_name):
-                return getattr(lisan, field_name)
+        fallback_languages = fallback_languages or \
+            get_lisan_settings().fallback_languages
+        # Try to get the field from the first available translation
+        lisan = self._get_first_lisan([language_code, *fallback_languages])
+        if lisan and hasattr(lisan, field_name):
+            return getattr(lisan, field_name)
 
         # If auto-translation is enabled, use the translation service
         if auto_translate:
@@ -223,6 +379,103 @@ class LisanModelMixin(models.Model, metaclass=LisanModelMeta):
         # Fallback to default field
         return getattr(self, field_name)
 
+    def get_lisan_fields(
+            self, language_code=None,
+            field_names=None,
+            fallback_languages=None):
+        """
+        Retrieve the values of several fields from the Lisan model at once.
+
+        The translation is resolved once for all the fields, using the same
+        fallback rules as `get_lisan_field` without auto-translation.
+
+        Args:
+            language_code (str, optional): The language code to retrieve the
+                                           fields for. Defaults to the current
+                                           language if not provided.
+            field_names (iterable, optional): The fields to retrieve. Defaults
+                                              to all the `lisan_fields`.
+            fallback_languages (list, optional): A list of fallback language
+                                                 codes to try if there is no
+                                                 translation in the specified
+                                                 language. Defaults to the
+                                                 configured fallback
+                                                 languages.
+
+        Returns:
+            dict: The value of each field, taken from the first available
+                  translation or from the main model if there is none.
+        """
+        language_code = language_code or self._current_language
+        fallback_languages = fallback_languages or \
+            get_lisan_settings().fallback_languages
+        if field_names is None:
+            field_names = self.lisan_fields
+
+        lisan = self._get_first_lisan([language_code, *fallback_languages])
+        source = self if lisan is None else lisan
+        return {
+            field_name: getattr(source, field_name)
+            for field_name in field_names
+        }
+
+    def _get_first_lisan(self, language_codes):
+        """
+        Retrieve the first existing translation among several languages.
+
+        Languages that are not cached yet are resolved with a single query
+        ordering the candidates by their position in `language_codes`,
+        instead of one query per language.
+
+        :param language_codes: The language codes to try, in order of
+                               preference.
+        :return: The first Lisan instance found, or None.
+        """
+        if self._lisan_prefetch_attr in self.__dict__:
+            for lang in language_codes:
+                lisan = self.get_lisan(lang)
+                if lisan is not None:
+                    return lisan
+            return None
+
+        # Answer from the cache while the languages are already known
+        lisan_cache = self._get_lisan_cache()
+        for position, lang in enumerate(language_codes):
+            if lang not in lisan_cache:
+                break
+            if lisan_cache[lang] is not None:
+                return lisan_cache[lang]
+        else:
+            return None
+
+        remaining_codes = language_codes[position:]
+        candidates = [
+            lang for lang in dict.fromkeys(remaining_codes)
+            if lang not in lisan_cache
+        ]
+        preference = Case(
+            *[When(language_code=lang, then=rank)
+              for rank, lang in enumerate(candidates)],
+            output_field=IntegerField()
+        )
+        best_match = self.Lisan.objects.filter(
+            language_code__in=candidates,
+            **{self._meta.model_name: self}
+        ).order_by(preference).first()
+
+        # Candidates preferred over the best match have no translation
+        for lang in remaining_codes:
+            if lang in lisan_cache:
+                if lisan_cache[lang] is not None:
+                    return lisan_cache[lang]
+            elif best_match is not None and \
+                    lang == best_match.language_code:
+                lisan_cache[lang] = best_match
+                return best_match
+            else:
+                lisan_cache[lang] = None
+        return None
+
     def set_current_language(self, language_code):
         """
         Set the current language for the model instance.
@@ -263,7 +516,67 @@ class LisanModelMixin(models.Model, metaclass=LisanModelMeta):
             >>> instance.is_field_translatable('non_translatable_field')
             False
         """
-        return field_name in self.lisan_fields
+        return field_name in self._lisan_fields_set
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        """
+        Reload the instance from the database, dropping cached translations.
+
+        Like Django does for prefetched relations, the translations are
+        only dropped when all fields are reloaded or when the translations
+        relation is named in `fields`. Loading a deferred field also goes
+        through this method and keeps them.
+        """
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        if fields is None or f"{self._meta.model_name}_lisans" in fields:
+            self._clear_lisan_cache()
+
+    def _get_lisan_cache(self):
+        """
+        Return the translations already fetched for this instance.
+
+        :return: A dictionary mapping language codes to Lisan instances, or
+                 to None for languages without a translation.
+        """
+        return self.__dict__.setdefault('_lisan_by_lang', {})
+
+    def _clear_lisan_cache(self, language_code=None):
+        """
+        Forget the cached and prefetched translations of this instance.
+
+        :param language_code: Only forget the cached translation for this
+                              language. Defaults to all languages.
+        """
+        self.__dict__.pop(self._lisan_prefetch_attr, None)
+        if language_code is None:
+            self.__dict__.pop('_lisan_by_lang', None)
+        else:
+            self._get_lisan_cache().pop(language_code, None)
+
+    def _get_lisan_primary_key_names(self):
+        """
+        Return the names under which the Lisan primary key can be given.
+
+        :return: A set holding the name and attribute name of the primary
+                 key of the Lisan model.
+        """
+        primary_key_field = self.Lisan._meta.pk
+        return {primary_key_field.name, primary_key_field.attname}
+
+    def _check_lisan_fields(self, field_names):
+        """
+        Ensure the given fields exist in the translation model.
+
+        :param field_names: A set-like view of the field names to check.
+        :raises FieldDoesNotExist: If one of the fields does not exist.
+        """
+        unknown_fields = field_names - self.Lisan._lisan_field_names
+        if unknown_fields:
+            # Report a single field, picked deterministically
+            raise FieldDoesNotExist(
+                f"Field '{min(unknown_fields)}' does not exist in the "
+                "translation model."
+            )
 
     def _validate_language_code(self, language_code):
         """
@@ -276,11 +589,9 @@ class LisanModelMixin(models.Model, metaclass=LisanModelMeta):
         if not language_code:
             raise ValueError("Language code must be provided")
 
-        # Retrieve default and allowed languages from settings with
-        # fallback values
-        default_language = getattr(settings, 'LISAN_DEFAULT_LANGUAGE', 'en')
-        supported_languages = getattr(
-            settings, 'LISAN_ALLOWED_LANGUAGES', [default_language])
+        # Default and allowed languages are read once from the settings
+        lisan_settings = get_lisan_settings()
 
-        if language_code not in supported_languages:
-            raise ValueError(f"Unsupported language code: {language_code}. Supported languages are: {supported_languages}") # noqa
+        if language_code not in lisan_settings.allowed_language_set:
+            supported_languages = lisan_settings.allowed_languages
+            raise ValueError(f"Unsupported language code: {language_code}. Supported languages are: {list(supported_languages)}") # noqa
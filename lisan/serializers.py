@@ -1,7 +1,10 @@
-from django.conf import settings
+from django.db.models import prefetch_related_objects
+from django.utils.functional import cached_property
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
+from lisan.utils import get_lisan_settings
+
 
 class TranslationSerializer(serializers.Serializer):
     """
@@ -21,6 +24,33 @@ class TranslationSerializer(serializers.Serializer):
                 allow_blank=True, required=False)
 
 
+# TranslationSerializer subclasses declaring the fields of a given set of
+# `lisan_fields`, shared by all the serializers translating those fields
+_translation_serializer_classes = {}
+
+
+def _get_translation_serializer_class(lisan_fields):
+    """
+    Return a `TranslationSerializer` subclass declaring `lisan_fields`.
+
+    Declared fields are only copied when a serializer is instantiated,
+    instead of being created one by one on every instantiation.
+    """
+    lisan_fields = tuple(lisan_fields)
+    serializer_class = _translation_serializer_classes.get(lisan_fields)
+    if serializer_class is None:
+        serializer_class = type(
+            'TranslationSerializer',
+            (TranslationSerializer,),
+            {
+                field: serializers.CharField(allow_blank=True, required=False)
+                for field in lisan_fields
+            }
+        )
+        _translation_serializer_classes[lisan_fields] = serializer_class
+    return serializer_class
+
+
 class LisanSerializerMixin(serializers.ModelSerializer):
     """
     A serializer mixin that handles dynamic language translations
@@ -30,83 +60,203 @@ class LisanSerializerMixin(serializers.ModelSerializer):
     based on the requested language.
     """
 
+    # Request methods for which the `translations` field is accepted
+    translation_methods = frozenset({'POST', 'PUT', 'PATCH'})
+
+    # The translatable fields of `Meta.model`, bound on each subclass
+    _lisan_fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Bind the translatable fields of the serialized model to the class,
+        so they are not looked up on the model for every instance.
+        """
+        super().__init_subclass__(**kwargs)
+        model = getattr(getattr(cls, 'Meta', None), 'model', None)
+        cls._lisan_fields = tuple(getattr(model, 'lisan_fields', None) or ())
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the serializer, setting up the request context,
-        allowed languages, and default language. Also handles the
-        addition or removal of dynamic fields based on the request method.
+        allowed languages, and default language. The `translations` field
+        is added by `get_fields` depending on the request method.
         """
         super().__init__(*args, **kwargs)
         self.request = self.context.get('request', None)
-        self.allowed_languages = getattr(
-            settings, 'LISAN_ALLOWED_LANGUAGES', ['en']
-        )
-        self.default_language = getattr(
-            settings, 'LISAN_DEFAULT_LANGUAGE', 'en'
-        )
+        lisan_settings = get_lisan_settings()
+        self.allowed_languages = lisan_settings.allowed_languages
+        # Membership tests use the set, iteration keeps the settings order
+        self.allowed_language_set = lisan_settings.allowed_language_set
+        self.default_language = lisan_settings.default_language
+
+    def get_fields(self):
+        """
+        Return the serializer fields, including the `translations` field
+        for POST, PUT, and PATCH requests.
+
+        The fields are only built when they are first accessed, instead of
+        being built and then modified on every instantiation.
+        """
+        fields = super().get_fields()
+        if self._accepts_translations():
+            fields['translations'] = self._build_translations_field()
+        return fields
 
-        # Initialize `translations` with the nested
-        # serializer for each language entry
-        self.fields['translations'] = serializers.ListSerializer(
-            child=TranslationSerializer(
-                lisan_fields=getattr(self.Meta.model, 'lisan_fields', [])),
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Prefetch the translations of the objects in `queryset`.
+
+        `to_representation` reads every translatable field in every allowed
+        language, which otherwise costs one query per field and language
+        for each object. Call this from the view's `get_queryset` so all
+        translations are loaded with a single extra query.
+
+        Only the translations that can be rendered are loaded: the allowed
+        languages and the fallback languages.
+
+        Args:
+            queryset (QuerySet): The queryset of the serialized model.
+
+        Returns:
+            QuerySet: The queryset with the translations prefetched.
+        """
+        return queryset.prefetch_related(cls._get_translations_prefetch())
+
+    @classmethod
+    def _get_translations_prefetch(cls):
+        """
+        Build the prefetch of the translations that can be rendered.
+        """
+        model = cls.Meta.model
+        lisan_settings = get_lisan_settings()
+        language_codes = set(lisan_settings.allowed_languages).union(
+            lisan_settings.fallback_languages)
+        return model.get_lisan_prefetch(
+            model.Lisan.objects.filter(language_code__in=language_codes))
+
+    def _accepts_translations(self):
+        """
+        Return whether the current request may write translations.
+        """
+        method = getattr(self.request, 'method', None)
+        return method in self.translation_methods
+
+    def _build_translations_field(self):
+        """
+        Build the nested serializer for each language entry.
+        """
+        translation_serializer_class = _get_translation_serializer_class(
+            self._lisan_fields)
+        return serializers.ListSerializer(
+            child=translation_serializer_class(),
             required=False,
             write_only=True
         )
 
-        self._handle_dynamic_fields()
-
     def _handle_dynamic_fields(self):
         """
         Handle the inclusion or exclusion of the 'translations' field
         in the serializer based on the request method. The field is
         added for POST, PUT, and PATCH requests and removed otherwise.
+
+        `get_fields` already applies this when the fields are built; this
+        is only needed after the fields were modified afterwards.
         """
-        if self.request and self.request.method in ['POST', 'PUT', 'PATCH']:
+        if self._accepts_translations():
             if 'translations' not in self.fields:
-                self.fields['translations'] = serializers.ListSerializer(
-                    child=TranslationSerializer(
-                        lisan_fields=getattr(
-                            self.Meta.model, 'lisan_fields', [])),
-                    required=False,
-                    write_only=True
-                )
+                self.fields['translations'] = \
+                    self._build_translations_field()
         else:
             self.fields.pop('translations', None)
 
-    def to_representation(self, instance):
+    @cached_property
+    def _effective_language(self):
         """
-        Override the default representation of the instance to include
-        language-specific fields based on the requested language.
+        The request's language, or the default language when it is not
+        allowed, computed once per serializer for reads and writes.
         """
-        representation = super().to_representation(instance)
         language_code = getattr(
             self.request, 'language_code', self.default_language
         )
 
         # Ensure the language code is within the allowed languages
-        if language_code not in self.allowed_languages:
+        if language_code not in self.allowed_language_set:
             language_code = self.default_language
+        return language_code
 
-        # Modify the representation to include language-specific fields
-        if hasattr(instance, 'lisan_fields'):
-            for field in instance.lisan_fields:
-                if field in representation:
-                    representation[field] = instance.get_lisan_field(
-                        field, language_code
-                    )
+    @cached_property
+    def _translated_field_names(self):
+        """
+        The serialized fields that are translatable, in `lisan_fields`
+        order, computed once for all the serialized objects.
+        """
+        readable_fields = {
+            field.field_name for field in self._readable_fields}
+        return tuple(
+            field_name
+            for field_name in self._lisan_fields
+            if field_name in readable_fields
+        )
 
-        # Add structured `translations` with data for each language
+    @cached_property
+    def _translation_template(self):
+        """
+        The keys of each entry of the `translations` block, in order.
+        """
+        return dict.fromkeys(('language_code', *self._lisan_fields))
+
+    def to_representation(self, instance):
+        """
+        Override the default representation of the instance to include
+        language-specific fields based on the requested language.
+        """
+        representation = super().to_representation(instance)
+        language_code = self._effective_language
+
+        # Load all the translations with one query when the queryset was not
+        # set up with `setup_eager_loading`, instead of one per language.
+        # The prefetch only holds the languages rendered here, so it is
+        # dropped again below rather than left on the caller's instance.
+        prefetched = instance._lisan_prefetch_attr not in instance.__dict__
+        if prefetched:
+            prefetch_related_objects(
+                [instance], self._get_translations_prefetch())
+        try:
+            self._add_translations(representation, instance, language_code)
+        finally:
+            if prefetched:
+                instance.__dict__.pop(instance._lisan_prefetch_attr, None)
+        return representation
+
+    def _add_translations(self, representation, instance, language_code):
+        """
+        Add the translated fields and the `translations` list to the
+        representation of an instance.
+        """
+        # Add structured `translations` with data for each language,
+        # resolving each language's translation once for all its fields
         translations_representation = []
+        requested_values = None
         for lang_code in self.allowed_languages:
-            translation_data = {'language_code': lang_code}
-            for field in instance.lisan_fields:
-                translation_data[field] = instance.get_lisan_field(
-                    field, lang_code)
+            values = instance.get_lisan_fields(lang_code)
+            if lang_code == language_code:
+                requested_values = values
+            # Start from a copy of the pre-sized template so the dict is
+            # never resized while its keys are filled in
+            translation_data = self._translation_template.copy()
+            translation_data['language_code'] = lang_code
+            translation_data.update(values)
             translations_representation.append(translation_data)
 
+        # Modify the representation to include language-specific fields,
+        # reusing the values resolved above for the requested language
+        if requested_values is None:
+            requested_values = instance.get_lisan_fields(language_code)
+        for field_name in self._translated_field_names:
+            representation[field_name] = requested_values[field_name]
+
         representation['translations'] = translations_representation
-        return representation
 
     def create(self, validated_data):
         """
@@ -116,14 +266,6 @@ class LisanSerializerMixin(serializers.ModelSerializer):
         """
         translations = validated_data.pop('translations', [])
         self._validate_translations(translations)
-        language_code = getattr(
-            self.request, 'language_code', self.default_language
-        )
-
-        # Ensure the language code is within allowed languages,
-        if language_code not in self.allowed_languages:
-            # eventhought it's hard to reach here
-            language_code = self.default_language
 
         # Create the main instance
         instance = super().create(validated_data)
@@ -139,43 +281,43 @@ class LisanSerializerMixin(serializers.ModelSerializer):
         """
         translations = validated_data.pop('translations', [])
         self._validate_translations(translations, partial=True)
-        language_code = getattr(
-            self.request, 'language_code', self.default_language
-        )
-
-        # Ensure the language code is within allowed languages
-        if language_code not in self.allowed_languages:
-            # eventhought it's hard to reach here
-            language_code = self.default_language
-
-        # Track translatable fields updated in the main model
-        translatable_updates = {
-            field: validated_data[field]
-            for field in self.Meta.model.lisan_fields
-            if field in validated_data
-        }
+        language_code = self._effective_language
+
+        # Synchronize translatable fields updated in the main model with
+        # the default language translation, then apply the given
+        # translations on top. Payloads that only touch non-translatable
+        # fields skip this with a single set check.
+        all_translations = []
+        if not self.Meta.model._lisan_fields_set.isdisjoint(validated_data):
+            all_translations.append({
+                'language_code': language_code,
+                **{
+                    field: validated_data[field]
+                    for field in self._lisan_fields
+                    if field in validated_data
+                }
+            })
 
         # Update the main instance with non-translation fields
         instance = super().update(instance, validated_data)
 
-        # Synchronize updated translatable fields with the default
-        # language translation
-        if translatable_updates:
-            instance.set_lisan(language_code, **translatable_updates)
-
-        # Process and save the translations
         for translation in translations:
             lang_code = translation.get('language_code', language_code)
 
             # Only include fields that are present in the translation
             lisan_fields = {
                 field: translation[field]
-                for field in self.Meta.model.lisan_fields
+                for field in self._lisan_fields
                 if field in translation
             }
 
             if lisan_fields:
-                instance.set_lisan(lang_code, **lisan_fields)
+                all_translations.append(
+                    {'language_code': lang_code, **lisan_fields})
+
+        # Save every translation with a single bulk write
+        if all_translations:
+            instance.set_bulk_lisans(all_translations)
 
         return instance
 
@@ -193,30 +335,41 @@ class LisanSerializerMixin(serializers.ModelSerializer):
                 raise ValidationError("Translations are required.")
             return
 
-        translation_languages = {
-            translation['language_code'] for translation in translations
-        }
-        missing_languages = set(self.allowed_languages) - translation_languages
-
-        if missing_languages and not partial:
-            raise ValidationError(
-                "Missing translations for languages: "
-                f"{', '.join(missing_languages)}"
-            )
+        # Precomputed on the model, so nothing is rebuilt per call
+        required_fields = self.Meta.model._lisan_fields_set
+        translation_languages = set()
+        first_error = None
 
+        # Check every translation in a single pass, keeping the first
+        # problem found so the missing languages are still reported first
         for translation in translations:
             lang_code = translation.get('language_code')
-            if lang_code not in self.allowed_languages:
-                raise ValidationError(
-                    f"Unsupported language code: {lang_code}"
-                )
-
-            if not partial:
-                missing_fields = set(
-                    self.Meta.model.lisan_fields
-                ) - translation.keys()
+            translation_languages.add(lang_code)
+            if first_error is not None:
+                continue
+
+            if lang_code not in self.allowed_language_set:
+                first_error = f"Unsupported language code: {lang_code}"
+                if partial:
+                    # Missing languages are not reported for partial
+                    # updates, so there is nothing left to check
+                    break
+            elif not partial:
+                missing_fields = required_fields.difference(translation)
                 if missing_fields:
-                    raise ValidationError(
+                    first_error = (
                         f"Missing fields for {lang_code}: "
                         f"{', '.join(missing_fields)}"
                     )
+
+        if not partial:
+            missing_languages = (
+                self.allowed_language_set - translation_languages)
+            if missing_languages:
+                raise ValidationError(
+                    "Missing translations for languages: "
+                    f"{', '.join(missing_languages)}"
+                )
+
+        if first_error is not None:
+            raise ValidationError(first_error)
@@ -6,8 +6,13 @@ class BaseTranslationService:
     must implement. Specifically, any subclass must provide its own
     implementation of the `translate` method, which will handle translating 
     text to the target language.
+
+    The class declares empty `__slots__`, so subclasses listing their own
+    attributes in `__slots__` get instances without a `__dict__`.
     """
 
+    __slots__ = ()
+
     def translate(self, text, target_language):
         """
         Translate the given text to the target language.
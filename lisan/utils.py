@@ -1,7 +1,62 @@
+from collections import namedtuple
+from functools import lru_cache
 from importlib import import_module
+
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+LisanSettings = namedtuple(
+    'LisanSettings',
+    [
+        'default_language', 'allowed_languages', 'allowed_language_set',
+        'fallback_languages'
+    ]
+)
+
 
+@lru_cache(maxsize=1)
+def get_lisan_settings():
+    """
+    Return the language settings of the package, read once and cached.
+
+    Reading attributes from `django.conf.settings` goes through the lazy
+    settings wrapper every time, and the language settings are consulted
+    for every translated field. The cache is cleared whenever one of the
+    `LISAN_*` settings is changed, e.g. with `override_settings`.
 
+    Returns:
+        LisanSettings: A named tuple holding the `default_language`, the
+                       `allowed_languages` in their configured order, the
+                       same languages as the `allowed_language_set`
+                       frozenset for membership tests, and the
+                       `fallback_languages`.
+    """
+    default_language = getattr(settings, 'LISAN_DEFAULT_LANGUAGE', 'en')
+    allowed_languages = tuple(getattr(
+        settings, 'LISAN_ALLOWED_LANGUAGES', [default_language]))
+    return LisanSettings(
+        default_language=default_language,
+        allowed_languages=allowed_languages,
+        allowed_language_set=frozenset(allowed_languages),
+        fallback_languages=tuple(getattr(
+            settings, 'LISAN_FALLBACK_LANGUAGES', ['en'])),
+    )
+
+
+@receiver(setting_changed)
+def _clear_lisan_settings(*, setting, **kwargs):
+    """
+    Drop the cached settings and translation service when a `LISAN_*`
+    setting changes.
+    """
+    if setting.startswith('LISAN_'):
+        get_lisan_settings.cache_clear()
+        get_translation_service.cache_clear()
+
+
+@lru_cache(maxsize=1)
 def get_translation_service():
     """
     Dynamically import and instantiate the translation service class defined 
@@ -13,6 +68,10 @@ def get_translation_service():
     The module and class name are extracted from this setting, and the class
     is imported dynamically. The class is then instantiated and returned.
 
+    The instance is created once and shared by all callers, so translation
+    services must not keep per-call state. Use
+    `get_translation_service.cache_clear()` to create a new one.
+
     Returns:
         object: An instance of the translation service class as defined in
                 the settings.
@@ -2,30 +2,40 @@ import os
 import sys
 import django
 from django.conf import settings
+from django.test.runner import get_max_test_processes
 from django.test.utils import get_runner
-import coverage
 
 if __name__ == '__main__':
-    # Initialize coverage and start it
-    cov = coverage.Coverage(source=[])
-    cov.start()
+    # Only measure coverage when requested, limited to the package
+    cov = None
+    if os.environ.get('LISAN_COVERAGE') == '1':
+        import coverage
+
+        cov = coverage.Coverage(source=['lisan'])
+        cov.start()
 
     # Set up Django environment
     os.environ['DJANGO_SETTINGS_MODULE'] = 'tests.settings'
     django.setup()
     TestRunner = get_runner(settings)
-    test_runner = TestRunner()
+    # Split the suite across processes when requested, e.g.
+    # LISAN_TEST_PARALLEL=auto or LISAN_TEST_PARALLEL=4
+    parallel = os.environ.get('LISAN_TEST_PARALLEL', '0')
+    if parallel == 'auto':
+        parallel = get_max_test_processes()
+    test_runner = TestRunner(parallel=int(parallel))
 
     # Run tests
     failures = test_runner.run_tests(['tests'])
 
-    # Stop coverage and save report
-    cov.stop()
-    cov.save()
+    if cov is not None:
+        # Stop coverage and save report
+        cov.stop()
+        cov.save()
 
-    # Generate coverage report
-    print("\nCoverage Report:")
-    cov.report(show_missing=True)
+        # Generate coverage report
+        print("\nCoverage Report:")
+        cov.report(show_missing=True)
 
     # Exit with appropriate status code
     sys.exit(bool(failures))
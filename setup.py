@@ -1,13 +1,15 @@
-from setuptools import setup, find_packages
-import os
+from contextlib import suppress
+from pathlib import Path
 
+from setuptools import setup, find_packages
 
-#  Function to safely read README.md for the long description
-def read_file(filename):
-    with open(filename, encoding='utf-8') as f:
-        return f.read()
 
-long_description = read_file('README.md') if os.path.exists('README.md') else '' # noqa
+# Read README.md for the long description, with a single open attempt and
+# relative to this file rather than the current directory
+long_description = ''
+with suppress(FileNotFoundError):
+    long_description = (
+        Path(__file__).parent / 'README.md').read_text(encoding='utf-8')
 
 setup(
     name='lisan',
@@ -3,9 +3,11 @@
 from lisan.translation_services import BaseTranslationService
 
 
+def _translate(text, target_language):
+    return f"{text} in {target_language}"
+
+
 class GoogleTranslateService(BaseTranslationService):
-    def __init__(self):
-        self.translator = lambda a, b: f"{a} in {b}"
+    __slots__ = ()
 
-    def translate(self, text, target_language):
-        return self.translator(text, target_language)
+    translate = staticmethod(_translate)
@@ -17,6 +17,12 @@ class TestModel(LisanModelMixin, models.Model):
         max_length=100, blank=True, null=True, default='')
 
 
+class AutoKeyModel(LisanModelMixin, models.Model):
+    lisan_fields = ['title']
+    lisan_primary_key_type = models.BigAutoField
+    title = models.CharField(max_length=100, blank=True, default='')
+
+
 class TheOtherModel(models.Model):
     name = models.CharField(max_length=100, blank=True, default='')
     title = models.CharField(max_length=100, blank=True, default='')
@@ -1,6 +1,5 @@
-from django.test import TestCase, RequestFactory
+from django.test import TestCase
 from django.contrib.admin.sites import AdminSite
-from django.db import models
 from django.contrib import admin
 from lisan.admin import LisanAdminMixin
 from tests.models import TestModel, SomeModel
@@ -13,12 +12,20 @@ class TestLisanAdminMixin(TestCase):
     support in the Django admin interface for models using LisanModelMixin.
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create the test model instance once for the class.
+        """
+        cls.instance = TestModel.objects.create(
+            title="Hello World",
+            description="Sample description"
+        )
+
     def setUp(self):
         """
-        Set up the test environment. Create a test model instance and an
-        admin instance for the tests.
+        Set up the test environment with an admin instance for the tests.
         """
-        self.factory = RequestFactory()
         self.site = AdminSite()
 
         # Create a test admin instance for the TestModel
@@ -26,10 +33,6 @@ class TestLisanAdminMixin(TestCase):
             model = TestModel
 
         self.admin = TestModelAdmin(model=TestModel, admin_site=self.site)
-        self.instance = TestModel.objects.create(
-            title="Hello World",
-            description="Sample description"
-        )
 
     def test_admin_initialization(self):
         """
@@ -40,6 +43,34 @@ class TestLisanAdminMixin(TestCase):
         self.assertIn('get_lisan_title', self.admin.list_display)
         self.assertIn('get_lisan_description', self.admin.list_display)
 
+    def test_getters_installed_once_per_class(self):
+        """
+        Test that the getters are installed on the admin class and that
+        instantiating the admin again does not duplicate `list_display`.
+        """
+        admin_class = type(self.admin)
+        self.assertIn('get_lisan_title', admin_class.__dict__)
+
+        second_admin = admin_class(model=TestModel, admin_site=self.site)
+        self.assertEqual(second_admin.list_display, self.admin.list_display)
+        self.assertEqual(
+            second_admin.list_display.count('get_lisan_title'), 1)
+
+    def test_getters_replace_declared_list_display(self):
+        """
+        Test that the getters replace a `list_display` declared on the
+        admin class, so installing them once per class keeps the columns
+        shown by earlier versions.
+        """
+        class DeclaredListDisplayAdmin(LisanAdminMixin, admin.ModelAdmin):
+            list_display = ('title', 'author')
+
+        admin_instance = DeclaredListDisplayAdmin(
+            model=TestModel, admin_site=self.site)
+        self.assertEqual(
+            admin_instance.list_display,
+            ('get_lisan_title', 'get_lisan_description'))
+
     def test_generated_getter_methods(self):
         """
         Test that getter methods for multilingual fields are dynamically
@@ -79,6 +110,16 @@ class TestLisanAdminMixin(TestCase):
         self.assertTrue(issubclass(inline_class, admin.TabularInline))
         self.assertEqual(inline_class.model, TestModel.Lisan)
 
+    def test_get_lisan_inline_is_cached(self):
+        """
+        Test that the inline class is built once per model and reused on
+        subsequent calls.
+        """
+        first_inline = self.admin.get_lisan_inline()
+        second_inline = self.admin.get_lisan_inline()
+        self.assertIs(first_inline, second_inline)
+        self.assertEqual(self.admin.get_inlines(None), [first_inline])
+
     def test_get_lisan_inline_no_lisan_model(self):
         """
         Test that get_lisan_inline raises ImproperlyConfigured if no
@@ -110,8 +151,8 @@ class TestLisanAdminMixin(TestCase):
         self.assertTrue(issubclass(inlines[0], admin.TabularInline))
 
         # Verify that no inlines are returned for models without lisan_fields
-        class NoLisanModel(models.Model):
-            pass
+        class NoLisanModel:
+            _meta = SomeModel._meta
 
         class NoLisanModelAdmin(LisanAdminMixin, admin.ModelAdmin):
             model = NoLisanModel
@@ -125,8 +166,8 @@ class TestLisanAdminMixin(TestCase):
         Test that the admin mixin does not add any getters or modify
         `list_display` for models that do not define `lisan_fields`.
         """
-        class NoLisanModel(models.Model):
-            name = models.CharField(max_length=100)
+        class NoLisanModel:
+            _meta = SomeModel._meta
 
         class NoLisanModelAdmin(LisanAdminMixin, admin.ModelAdmin):
             model = NoLisanModel
@@ -142,7 +183,8 @@ class TestLisanAdminMixin(TestCase):
         Test the behavior of the admin mixin when the model's `lisan_fields`
         is an empty list.
         """
-        class EmptyLisanModel(models.Model):
+        class EmptyLisanModel:
+            _meta = SomeModel._meta
             lisan_fields = []
 
         class EmptyLisanModelAdmin(LisanAdminMixin, admin.ModelAdmin):
@@ -1,5 +1,5 @@
-from django.conf import settings
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.test.utils import isolate_apps
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError, models
 from lisan.mixins import LisanModelMixin
@@ -7,18 +7,20 @@ from lisan.metaclasses import create_lisan_model  # LisanModelMeta
 from tests.models import TestModel
 
 
+@override_settings(LISAN_PRIMARY_KEY_TYPE=models.UUIDField)
 class MetaclassesTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.instance = TestModel.objects.create(
+            title="Hello World",
+            description="Sample description"
+        )
+
     def setUp(self):
-        # Update settings for testing
-        settings.LISAN_PRIMARY_KEY_TYPE = models.UUIDField
         self.fields = {
             'title': models.CharField(max_length=100, blank=True, default=''),
             'description': models.TextField(blank=True, default='')
         }
-        self.instance = TestModel.objects.create(
-            title="Hello World",
-            description="Sample description"
-        )
 
     # Test the initial creation of a model
     def test_initial_creation(self):
@@ -84,9 +86,50 @@ class MetaclassesTestCase(TestCase):
         self.assertEqual(
             constraints[0].fields, tuple(['language_code', 'testmodel']))
 
+        # Assert the ForeignKey keeps its own index
+        self.assertTrue(lisan_model._meta.get_field('testmodel').db_index)
+
+        # Assert the field names accepted when setting translations
+        self.assertEqual(
+            lisan_model._lisan_field_names,
+            {'id', 'language_code', 'title', 'description',
+             'testmodel', 'testmodel_id'})
+
         # Assert the table name
         self.assertEqual(lisan_model._meta.db_table, 'tests_testmodel_lisan')
 
+    def test_create_lisan_model_is_memoized(self):
+        lisan_model = create_lisan_model(
+            TestModel, self.fields, models.UUIDField)
+        self.assertIs(
+            create_lisan_model(TestModel, self.fields, models.UUIDField),
+            lisan_model)
+        # The Lisan model built by the metaclass is reused as well
+        self.assertIs(lisan_model, TestModel.Lisan)
+
+    @isolate_apps('tests')
+    def test_create_lisan_model_with_other_definitions(self):
+        lisan_model = create_lisan_model(
+            TestModel, self.fields, models.UUIDField)
+        # The isolated registry gets its own model
+        self.assertIsNot(lisan_model, TestModel.Lisan)
+
+        # Same names, different definitions: a new model is built (and
+        # registered again under the same name)
+        with self.assertWarns(RuntimeWarning):
+            other_model = create_lisan_model(
+                TestModel,
+                {'title': models.CharField(max_length=5),
+                 'description': models.TextField(blank=True, default='')},
+                models.UUIDField)
+        self.assertIsNot(other_model, lisan_model)
+        self.assertEqual(other_model._meta.get_field('title').max_length, 5)
+
+    def test_lisan_fields_are_frozen(self):
+        self.assertEqual(TestModel.lisan_fields, ('title', 'description'))
+        self.assertEqual(
+            TestModel._lisan_fields_set, frozenset({'title', 'description'}))
+
     def test_missing_lisan_fields(self):
         with self.assertRaises(AttributeError):
             class InvalidModel(LisanModelMixin, models.Model):
@@ -101,6 +144,15 @@ class MetaclassesTestCase(TestCase):
         with self.assertRaises(TypeError):
             create_lisan_model(TestModel, self.fields, primary_key_type=str)
 
+    def test_non_class_primary_key_type(self):
+        with self.assertRaises(TypeError) as context:
+            create_lisan_model(
+                TestModel, self.fields, primary_key_type="invalid_type")
+        self.assertIn("Invalid primary_key_type", str(context.exception))
+
+    # Models built only for a test are registered in an isolated app
+    # registry so they do not replace TestModel's reverse relation
+    @isolate_apps('tests')
     def test_default_primary_key_type(self):
         lisan_model = create_lisan_model(TestModel, self.fields)
         self.assertEqual(
@@ -123,12 +175,13 @@ class MetaclassesTestCase(TestCase):
                 description="Duplicate description",
                 testmodel_id=self.instance.id
             )
-            duplicate_instance.clean()
+            duplicate_instance.validate_constraints()
 
     def test_missing_model_class(self):
         with self.assertRaises(AttributeError):
             create_lisan_model(None, self.fields)
 
+    @isolate_apps('tests')
     def test_empty_fields(self):
         lisan_model = create_lisan_model(TestModel, {}, models.UUIDField)
         self.assertFalse(hasattr(lisan_model, 'title'))
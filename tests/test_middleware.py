@@ -1,9 +1,19 @@
-from django.test import TestCase, RequestFactory
-from django.conf import settings
-from unittest.mock import MagicMock, Mock
-from lisan.middleware import LanguageMiddleware
+from django.contrib.auth.models import AnonymousUser
+from django.test import (
+    RequestFactory, SimpleTestCase, TestCase, override_settings)
+from django.utils.functional import SimpleLazyObject
+from types import SimpleNamespace
+from unittest.mock import Mock
+from lisan.middleware import LanguageMiddleware, _parse_accept_language_tags
 
+# Neither holds per-request state, so they are shared by all the tests
+_FACTORY = RequestFactory()
+_MIDDLEWARE = LanguageMiddleware(get_response=Mock())
 
+
+@override_settings(
+    LISAN_DEFAULT_LANGUAGE='en',
+    LISAN_ALLOWED_LANGUAGES=['en', 'am', 'or', 'tg'])
 class TestLanguageMiddleware(TestCase):
     """
     Test suite for the LanguageMiddleware class, which sets the language
@@ -15,12 +25,8 @@ class TestLanguageMiddleware(TestCase):
         Set up the test environment, including the middleware instance
         and request factory.
         """
-        self.factory = RequestFactory()
-        self.middleware = LanguageMiddleware(get_response=Mock())
-
-        # Set test settings for language configuration
-        settings.LISAN_DEFAULT_LANGUAGE = 'en'
-        settings.LISAN_ALLOWED_LANGUAGES = ['en', 'am', 'or', 'tg']
+        self.factory = _FACTORY
+        self.middleware = _MIDDLEWARE
 
     def test_language_from_get_parameter(self):
         """
@@ -36,8 +42,8 @@ class TestLanguageMiddleware(TestCase):
         Test that the middleware extracts the language code from the user's
         profile preference if available.
         """
-        mock_user = MagicMock()
-        mock_user.profile.language_preference = 'or'
+        mock_user = SimpleNamespace(
+            profile=SimpleNamespace(language_preference='or'))
         request = self.factory.get('/')
         request.user = mock_user
 
@@ -72,6 +78,32 @@ class TestLanguageMiddleware(TestCase):
         self.middleware.process_request(request)
         self.assertEqual(request.language_code, 'en')
 
+    def test_user_without_profile_falls_back(self):
+        """
+        Test that a user without a profile, such as an anonymous user, falls
+        back to the default language instead of raising.
+        """
+        request = self.factory.get('/')
+        request.user = AnonymousUser()
+
+        self.middleware.process_request(request)
+        self.assertEqual(request.language_code, 'en')
+
+    def test_settings_changes_are_picked_up(self):
+        """
+        Test that the middleware follows changes to the language settings
+        without being instantiated again.
+        """
+        with self.settings(
+                LISAN_DEFAULT_LANGUAGE='am', LISAN_ALLOWED_LANGUAGES=['am']):
+            request = self.factory.get('/?lang=or')
+            self.middleware.process_request(request)
+            self.assertEqual(request.language_code, 'am')
+
+        request = self.factory.get('/?lang=or')
+        self.middleware.process_request(request)
+        self.assertEqual(request.language_code, 'or')
+
     def test_unsupported_language(self):
         """
         Test that the middleware falls back to the default language when an
@@ -81,6 +113,106 @@ class TestLanguageMiddleware(TestCase):
         self.middleware.process_request(request)
         self.assertEqual(request.language_code, 'en')
 
+    def test_user_profile_takes_precedence_over_cookie_and_header(self):
+        """
+        Test that the user's profile preference is used before the cookie
+        and the 'Accept-Language' header sent by the browser.
+        """
+        mock_user = SimpleNamespace(
+            profile=SimpleNamespace(language_preference='am'))
+        request = self.factory.get(
+            '/', HTTP_ACCEPT_LANGUAGE='en-US,en;q=0.9')
+        request.user = mock_user
+        request.COOKIES['language'] = 'tg'
+
+        self.middleware.process_request(request)
+        self.assertEqual(request.language_code, 'am')
+
+    def test_unsupported_source_uses_default_language(self):
+        """
+        Test that an unsupported language in a higher precedence source
+        resolves to the default language instead of a lower source.
+        """
+        request = self.factory.get('/?lang=xx', HTTP_ACCEPT_LANGUAGE='am')
+        self.middleware.process_request(request)
+        self.assertEqual(request.language_code, 'en')
+
+    def test_language_precedence(self):
+        """
+        Test that the middleware applies the correct precedence when
+        multiple language sources are available.
+        """
+        mock_user = SimpleNamespace(
+            profile=SimpleNamespace(language_preference='or'))
+        request = self.factory.get('/?lang=am', HTTP_ACCEPT_LANGUAGE='tg')
+        request.user = mock_user
+        request.COOKIES['language'] = 'tg'
+
+        # GET parameter should take precedence
+        self.middleware.process_request(request)
+        self.assertEqual(request.language_code, 'am')
+
+    def test_get_parameter_does_not_resolve_user(self):
+        """
+        Test that the lazy user is not resolved when the GET parameter
+        already provides a supported language.
+        """
+        def resolve_user():
+            self.fail("request.user should not be resolved")
+
+        request = self.factory.get('/?lang=am')
+        request.user = SimpleLazyObject(resolve_user)
+
+        with self.assertNumQueries(0):
+            self.middleware.process_request(request)
+        self.assertEqual(request.language_code, 'am')
+
+    def test_accept_language_is_case_insensitive(self):
+        """
+        Test that header tags are matched case-insensitively and resolve to
+        the language code as configured.
+        """
+        request = self.factory.get('/', HTTP_ACCEPT_LANGUAGE='AM, EN;q=0.8')
+        self.middleware.process_request(request)
+        self.assertEqual(request.language_code, 'am')
+
+        with self.settings(LISAN_ALLOWED_LANGUAGES=['en', 'zh-Hans']):
+            request = self.factory.get('/', HTTP_ACCEPT_LANGUAGE='zh-hans')
+            self.middleware.process_request(request)
+            self.assertEqual(request.language_code, 'zh-Hans')
+
+    def test_accept_language_falls_back_to_primary_subtag(self):
+        """
+        Test that a regional tag that is not allowed resolves to its
+        primary language.
+        """
+        request = self.factory.get(
+            '/', HTTP_ACCEPT_LANGUAGE='fr-CA, am-ET;q=0.8, en;q=0.5')
+        self.middleware.process_request(request)
+        self.assertEqual(request.language_code, 'am')
+
+    def test_accept_language_uses_first_supported_language(self):
+        """
+        Test that an unsupported preferred language in the header does not
+        hide a supported one listed after it.
+        """
+        request = self.factory.get('/', HTTP_ACCEPT_LANGUAGE='fr, am;q=0.8')
+        self.middleware.process_request(request)
+        self.assertEqual(request.language_code, 'am')
+
+
+class TestParseAcceptLanguage(SimpleTestCase):
+    """
+    Test suite for the parsing of the 'Accept-Language' header, which does
+    not need the database.
+    """
+
+    def setUp(self):
+        """
+        Set up the shared middleware instance.
+        """
+        self.middleware = _MIDDLEWARE
+
     def test_parse_accept_language_valid_header(self):
         """
         Test that parse_accept_language correctly extracts the primary language
@@ -89,6 +221,15 @@ class TestLanguageMiddleware(TestCase):
         result = self.middleware.parse_accept_language('am, en;q=0.8')
         self.assertEqual(result, 'am')
 
+    def test_parse_accept_language_single_tag(self):
+        """
+        Test that parse_accept_language handles a header holding a single
+        language tag.
+        """
+        self.assertEqual(self.middleware.parse_accept_language('am'), 'am')
+        self.assertEqual(self.middleware.parse_accept_language(' tg '), 'tg')
+        self.assertIsNone(self.middleware.parse_accept_language('   '))
+
     def test_parse_accept_language_empty_header(self):
         """
         Test that parse_accept_language returns None for an empty or missing
@@ -107,21 +248,6 @@ class TestLanguageMiddleware(TestCase):
         result = self.middleware.parse_accept_language(';;;')
         self.assertIsNone(result)
 
-    def test_language_precedence(self):
-        """
-        Test that the middleware applies the correct precedence when
-        multiple language sources are available.
-        """
-        mock_user = MagicMock()
-        mock_user.profile.language_preference = 'or'
-        request = self.factory.get('/?lang=am', HTTP_ACCEPT_LANGUAGE='tg')
-        request.user = mock_user
-        request.COOKIES['language'] = 'tg'
-
-        # GET parameter should take precedence
-        self.middleware.process_request(request)
-        self.assertEqual(request.language_code, 'am')
-
     def test_parse_accept_language_no_languages_extracted(self):
         """
         Test that parse_accept_language returns None when the header
@@ -134,3 +260,46 @@ class TestLanguageMiddleware(TestCase):
         # Header with malformed values that result in empty language codes
         result = self.middleware.parse_accept_language(' , ; , ; ')
         self.assertIsNone(result)
+
+    def test_parse_accept_language_quality_values(self):
+        """
+        Test that parse_accept_language orders the languages by quality
+        value and ignores the ones marked as not acceptable.
+        """
+        self.assertEqual(
+            self.middleware.parse_accept_language('en;q=0.5, am'), 'am')
+        self.assertEqual(
+            self.middleware.parse_accept_language('am;q=0, or;q=0.3'), 'or')
+        self.assertEqual(
+            _parse_accept_language_tags('en-US;level=1;q=0.2, tg, am;q=0.9'),
+            ('tg', 'am', 'en-US'))
+
+    def test_parse_accept_language_uppercase_quality(self):
+        """
+        Test that quality parameter names are case-insensitive.
+        """
+        self.assertEqual(
+            _parse_accept_language_tags('am;Q=0.1, en;q=0.5'), ('en', 'am'))
+
+    def test_parse_accept_language_malformed_quality(self):
+        """
+        Test that tags whose quality value cannot be parsed are dropped
+        instead of being promoted.
+        """
+        for header in ('en;q=abc, am;q=0.5', 'en;q=1e-1, am;q=0.05',
+                       'en;q=, am;q=0.5', 'en;q=0.5.5, am;q=0.5',
+                       'en;q=1.5, am;q=0.5'):
+            with self.subTest(header=header):
+                self.assertEqual(_parse_accept_language_tags(header), ('am',))
+
+    def test_parse_accept_language_is_cached(self):
+        """
+        Test that repeated 'Accept-Language' headers are served from the
+        parser cache.
+        """
+        _parse_accept_language_tags.cache_clear()
+        self.middleware.parse_accept_language('or, en;q=0.5')
+        result = self.middleware.parse_accept_language('or, en;q=0.5')
+
+        self.assertEqual(result, 'or')
+        self.assertEqual(_parse_accept_language_tags.cache_info().hits, 1)
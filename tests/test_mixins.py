@@ -1,7 +1,11 @@
-from django.test import TestCase
-from django.db import IntegrityError
-from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
-from tests.models import TestModel
+import uuid
+
+from django.test import TestCase, override_settings
+from django.db import IntegrityError, connection
+from django.core.exceptions import FieldDoesNotExist
+from lisan.translation_services import BaseTranslationService
+from lisan.utils import get_translation_service
+from tests.models import AutoKeyModel, TestModel
 from unittest.mock import patch
 
 
@@ -11,17 +15,25 @@ class TestLisanModelMixin(TestCase):
     support for Django models.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Set up the test environment. Create a test model instance and
-        translations for testing.
+        Set up the test data once for the whole class. Create a test model
+        instance and translations for testing; each test gets its own copy
+        of the instance and its changes are rolled back.
         """
-        self.instance = TestModel.objects.create(
+        cls.instance = TestModel.objects.create(
             title="Hello World",
             description="Sample description"
         )
-        self.instance.set_lisan('am', title="ሰላም ለዓለም", description="ምሳሌ መግለጫ")
-        self.instance.set_lisan('tg', title="ሰላም ዓለም")
+        cls.instance.set_bulk_lisans([
+            {
+                "language_code": "am",
+                "title": "ሰላም ለዓለም",
+                "description": "ምሳሌ መግለጫ"
+            },
+            {"language_code": "tg", "title": "ሰላም ዓለም"},
+        ])
 
     def test_get_lisan_existing_language(self):
         """
@@ -39,6 +51,79 @@ class TestLisanModelMixin(TestCase):
         lisan = self.instance.get_lisan('fr')
         self.assertIsNone(lisan)
 
+    def test_get_lisan_prefetched(self):
+        """
+        Test that get_lisan reads prefetched translations without querying.
+        """
+        instance = TestModel.objects.prefetch_related(
+            TestModel.get_lisan_prefetch()).get(pk=self.instance.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(instance.get_lisan('am').title, "ሰላም ለዓለም")
+            self.assertIsNone(instance.get_lisan('or'))
+
+    def test_deferred_field_keeps_prefetched_lisans(self):
+        """
+        Test that loading a deferred field does not drop the prefetched
+        translations.
+        """
+        instance = TestModel.objects.only('title').prefetch_related(
+            TestModel.get_lisan_prefetch()).get(pk=self.instance.pk)
+
+        # Loads the deferred field through refresh_from_db
+        with self.assertNumQueries(1):
+            self.assertEqual(instance.description, "Sample description")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(instance.get_lisan('am').title, "ሰላም ለዓለም")
+
+    def test_refresh_from_db_clears_lisans(self):
+        """
+        Test that reloading the instance, or its translations relation,
+        drops the cached and prefetched translations.
+        """
+        self.instance.get_lisan('am')
+        self.instance.refresh_from_db()
+        self.assertEqual(self.instance._get_lisan_cache(), {})
+
+        instance = TestModel.objects.prefetch_related(
+            TestModel.get_lisan_prefetch()).get(pk=self.instance.pk)
+        instance.refresh_from_db(fields=['title'])
+        self.assertIn('_prefetched_lisans', instance.__dict__)
+
+        instance.refresh_from_db(fields=['testmodel_lisans'])
+        self.assertNotIn('_prefetched_lisans', instance.__dict__)
+
+    def test_get_lisan_cached_per_instance(self):
+        """
+        Test that repeated lookups of the same language only query once,
+        including languages without a translation.
+        """
+        with self.assertNumQueries(2):
+            self.instance.get_lisan('am')
+            self.instance.get_lisan('am')
+            self.instance.get_lisan('or')
+            self.instance.get_lisan('or')
+
+    def test_get_lisan_only_requested_fields(self):
+        """
+        Test that get_lisan can load a subset of the translation fields
+        without caching the partial row.
+        """
+        lisan = self.instance.get_lisan('am', fields=['title'])
+        self.assertEqual(lisan.title, "ሰላም ለዓለም")
+        self.assertIn('description', lisan.get_deferred_fields())
+        self.assertNotIn('am', self.instance._get_lisan_cache())
+
+    def test_set_lisan_invalidates_cache(self):
+        """
+        Test that set_lisan drops the cached translation for its language.
+        """
+        self.assertIsNone(self.instance.get_lisan('or'))
+        self.instance.set_lisan('or', title="Nagaa Addunyaa")
+        self.assertEqual(
+            self.instance.get_lisan('or').title, "Nagaa Addunyaa")
+
     def test_set_lisan_new_language(self):
         """
         Test setting a translation for a new language.
@@ -71,6 +156,17 @@ class TestLisanModelMixin(TestCase):
         with self.assertRaises(ValueError):
             self.instance.set_lisan('xx', title="Unsupported Language")
 
+    def test_allowed_languages_follow_settings_changes(self):
+        """
+        Test that the cached language settings are refreshed when the
+        settings are overridden.
+        """
+        with override_settings(LISAN_ALLOWED_LANGUAGES=['en', 'fr']):
+            self.instance.set_current_language('fr')
+            with self.assertRaises(ValueError):
+                self.instance.set_current_language('am')
+        self.instance.set_current_language('am')
+
     def test_set_bulk_lisans(self):
         """
         Test setting translations in bulk for multiple languages.
@@ -87,7 +183,9 @@ class TestLisanModelMixin(TestCase):
                 "description": "በማይታወቁ መሬቶች ላይ አስገራሚ ጉዞ."
             }
         ]
-        self.instance.set_bulk_lisans(translations)
+        # A single upsert, whatever the number of languages
+        with self.assertNumQueries(1):
+            self.instance.set_bulk_lisans(translations)
 
         am_translation = self.instance.get_lisan('am')
         or_translation = self.instance.get_lisan('or')
@@ -96,6 +194,140 @@ class TestLisanModelMixin(TestCase):
         self.assertEqual(or_translation.title, "Nagaa Addunyaa")
         self.assertEqual(or_translation.description, "Fakkeenya")
 
+    def test_set_bulk_lisans_query_count(self):
+        """
+        Test that set_bulk_lisans writes translations setting the same
+        fields with a single upsert and leaves the given translations
+        untouched.
+        """
+        translations = [
+            {"language_code": "am", "title": "አዲስ ርዕስ"},
+            {"language_code": "or", "title": "Nagaa Addunyaa"},
+            {"language_code": "tg", "title": "ሰላም"},
+        ]
+        with self.assertNumQueries(1):
+            self.instance.set_bulk_lisans(translations)
+
+        self.assertEqual(translations[0]["language_code"], "am")
+        am_translation = self.instance.get_lisan('am')
+        self.assertEqual(am_translation.title, "አዲስ ርዕስ")
+        # Fields left out are not overwritten
+        self.assertEqual(am_translation.description, "ምሳሌ መግለጫ")
+        self.assertEqual(self.instance.get_lisan('tg').title, "ሰላም")
+
+    def test_set_bulk_lisans_mixed_fields(self):
+        """
+        Test that translations setting different fields only overwrite
+        their own fields.
+        """
+        self.instance.set_bulk_lisans([
+            {"language_code": "am", "description": "አዲስ መግለጫ"},
+            {"language_code": "tg", "title": "Салом"},
+            {"language_code": "or"},
+        ])
+
+        am_translation = self.instance.get_lisan('am')
+        self.assertEqual(am_translation.title, "ሰላም ለዓለም")
+        self.assertEqual(am_translation.description, "አዲስ መግለጫ")
+        self.assertEqual(self.instance.get_lisan('tg').title, "Салом")
+        self.assertEqual(self.instance.get_lisan('or').title, "")
+
+    def test_set_bulk_lisans_without_upsert_support(self):
+        """
+        Test that set_bulk_lisans falls back to a lookup followed by bulk
+        writes, without a savepoint when it only has to insert.
+        """
+        with patch.object(
+                connection.features, 'supports_update_conflicts', False):
+            with self.assertNumQueries(2):
+                self.instance.set_bulk_lisans([
+                    {"language_code": "or", "title": "Nagaa Addunyaa"},
+                ])
+            self.instance.set_bulk_lisans([
+                {"language_code": "am", "title": "አዲስ ርዕስ"},
+                {"language_code": "tg", "description": "መግለጫ"},
+            ])
+
+        self.assertEqual(self.instance.get_lisan('or').title, "Nagaa Addunyaa")
+        self.assertEqual(self.instance.get_lisan('am').title, "አዲስ ርዕስ")
+        self.assertEqual(self.instance.get_lisan('tg').title, "ሰላም ዓለም")
+
+    def test_set_lisan_primary_key_only_used_on_create(self):
+        """
+        Test that a primary key value passed to set_lisan is used for a new
+        translation but does not replace the key of an existing one.
+        """
+        new_pk = uuid.uuid4()
+        created = self.instance.set_lisan('or', id=new_pk, title="Nagaa")
+        self.assertEqual(created.pk, new_pk)
+
+        original_pk = self.instance.get_lisan('am').pk
+        updated = self.instance.set_lisan(
+            'am', id=uuid.uuid4(), title="አዲስ ርዕስ")
+        self.assertEqual(updated.pk, original_pk)
+        self.assertEqual(updated.title, "አዲስ ርዕስ")
+
+    def test_set_lisan_without_upsert_support(self):
+        """
+        Test that set_lisan falls back to a lookup followed by a single
+        insert or update, returning the written translation.
+        """
+        with patch.object(
+                connection.features, 'supports_update_conflicts', False):
+            with self.assertNumQueries(2):
+                created = self.instance.set_lisan('or', title="Nagaa")
+            with self.assertNumQueries(2):
+                updated = self.instance.set_lisan('am', title="አዲስ ርዕስ")
+
+        self.assertEqual(created.title, "Nagaa")
+        self.assertEqual(self.instance.get_lisan('or').pk, created.pk)
+        self.assertEqual(updated.title, "አዲስ ርዕስ")
+        self.assertEqual(updated.description, "ምሳሌ መግለጫ")
+
+    def test_set_bulk_lisans_without_upsert_support_uses_write_db(self):
+        """
+        Test that the fallback path reads and writes through the database
+        chosen for writing, like the upsert path.
+        """
+        lisan_manager = self.instance.Lisan.objects
+        with patch.object(
+                connection.features, 'supports_update_conflicts', False), \
+                patch.object(
+                    lisan_manager, 'db_manager',
+                    wraps=lisan_manager.db_manager) as mock_db_manager:
+            self.instance.set_bulk_lisans([
+                {"language_code": "or", "title": "Nagaa Addunyaa"},
+            ])
+        mock_db_manager.assert_called_once_with('default')
+
+    def test_set_lisan_without_returned_primary_keys(self):
+        """
+        Test that set_lisan returns a translation with its primary key on
+        backends where bulk_create cannot return generated keys.
+        """
+        instance = AutoKeyModel.objects.create(title="Hello World")
+        with patch.object(
+                connection.features, 'supports_update_conflicts', False), \
+                patch.object(
+                    type(connection.features),
+                    'can_return_rows_from_bulk_insert', False):
+            lisan = instance.set_lisan('am', title="ሰላም")
+
+        self.assertIsNotNone(lisan.pk)
+        self.assertEqual(lisan.pk, AutoKeyModel.Lisan.objects.get().pk)
+        self.assertIs(instance.get_lisan('am'), lisan)
+
+    def test_set_bulk_lisans_invalid_field(self):
+        """
+        Test that set_bulk_lisans rejects unknown fields before writing.
+        """
+        with self.assertRaises(FieldDoesNotExist):
+            self.instance.set_bulk_lisans([
+                {"language_code": "or", "title": "Nagaa Addunyaa"},
+                {"language_code": "tg", "non_existent_field": "value"},
+            ])
+        self.assertIsNone(self.instance.get_lisan('or'))
+
     def test_get_lisan_field_existing_language(self):
         """
         Test retrieving a field's value for an existing translation.
@@ -105,21 +337,65 @@ class TestLisanModelMixin(TestCase):
 
     def test_get_lisan_field_with_fallback(self):
         """
-        Test retrieving a field's value with fallback languages.
+        Test retrieving a field's value with fallback languages, looking up
+        the missing language and its fallback with a single query.
         """
-        title = self.instance.get_lisan_field(
-            'title', 'fr', fallback_languages=['tg'])
+        with self.assertNumQueries(1):
+            title = self.instance.get_lisan_field(
+                'title', 'fr', fallback_languages=['tg'])
         self.assertEqual(title, "ሰላም ዓለም")
 
-    def test_get_lisan_field_auto_translate(self):
+    def test_get_lisan_field_fallback_single_query(self):
         """
-        Test retrieving a field's value with auto-translation enabled.
+        Test that the requested language and its fallbacks are resolved
+        with one query, and that later lookups reuse the result.
         """
-        with patch('lisan.utils.get_translation_service') as mock_service:
-            mock_service.return_value = "Bonjour le monde"  # noqa
+        with self.assertNumQueries(1):
             title = self.instance.get_lisan_field(
-                'title', 'fr', auto_translate=True)
-            self.assertEqual(title, f"{self.instance.title} in fr")
+                'title', 'or', fallback_languages=['en', 'tg', 'am'])
+        self.assertEqual(title, "ሰላም ዓለም")
+
+        with self.assertNumQueries(0):
+            description = self.instance.get_lisan_field(
+                'description', 'or', fallback_languages=['en', 'tg', 'am'])
+        self.assertEqual(description, "")
+
+    def test_get_lisan_fields(self):
+        """
+        Test retrieving several fields with a single translation lookup,
+        falling back to the main model when there is no translation.
+        """
+        with self.assertNumQueries(1):
+            values = self.instance.get_lisan_fields('am')
+        self.assertEqual(
+            values, {'title': "ሰላም ለዓለም", 'description': "ምሳሌ መግለጫ"})
+
+        values = self.instance.get_lisan_fields(
+            'or', field_names=['title'], fallback_languages=['or'])
+        self.assertEqual(values, {'title': self.instance.title})
+
+    def test_get_lisan_field_auto_translate(self):
+        """
+        Test retrieving a field's value with auto-translation enabled,
+        using the translation service configured for the tests.
+        """
+        title = self.instance.get_lisan_field(
+            'title', 'fr', auto_translate=True)
+        self.assertEqual(title, f"{self.instance.title} in fr")
+
+    def test_translation_service_is_cached(self):
+        """
+        Test that the translation service is instantiated once and
+        recreated when its setting changes.
+        """
+        service = get_translation_service()
+        self.assertIs(get_translation_service(), service)
+
+        with override_settings(
+                LISAN_DEFAULT_TRANSLATION_SERVICE='lisan.translation_services.BaseTranslationService'):  # noqa: E501
+            self.assertIsInstance(
+                get_translation_service(), BaseTranslationService)
+        self.assertIsNot(get_translation_service(), service)
 
     def test_set_current_language(self):
         """
@@ -161,12 +437,14 @@ class TestLisanModelMixin(TestCase):
         """
         Test that get_lisan returns None if the Lisan object does not exist.
         """
+        empty_queryset = self.instance.Lisan.objects.none()
         with patch.object(
                 self.instance.Lisan.objects,
                 'filter',
-                side_effect=ObjectDoesNotExist):
+                return_value=empty_queryset) as mock_filter:
             lisan = self.instance.get_lisan('am')
             self.assertIsNone(lisan)
+        mock_filter.assert_called_once()
 
     def test_get_lisan_general_exception(self):
         """
@@ -194,46 +472,40 @@ class TestLisanModelMixin(TestCase):
 
     def test_set_lisan_primary_key_field(self):
         """
-        Test that set_lisan handles a primary key field that is not named 'id'.
+        Test that set_lisan handles a primary key field that is not named 'id'
+        and links the translation to the instance.
         """
-        # Create a Lisan translation with a custom primary key
-        lisan = self.instance.set_lisan(
-            'am', title="ሰላም", description="ምሳሌ"
-        )
+        lisan = self.instance.set_lisan('am', title="ሰላም", description="ምሳሌ")
         self.assertEqual(lisan.language_code, "am")
         self.assertEqual(lisan.title, "ሰላም")
         self.assertEqual(lisan.description, "ምሳሌ")
         self.assertEqual(lisan.testmodel_id, self.instance.id)
 
-    def test_set_lisan_primary_key_value(self):
-        """
-        Test that set_lisan sets the primary key value when provided.
-        """
-        lisan = self.instance.set_lisan(
-            'am', title="ሰላም", description="ምሳሌ"
-        )
-        self.assertEqual(lisan.language_code, "am")
-        self.assertEqual(lisan.testmodel_id, self.instance.id)
-
     def test_set_lisan_replaces_existing_translation(self):
         """
-        Test that set_lisan replaces the existing translation for a language
-        instead of creating a duplicate.
+        Test that set_lisan updates the existing translation for a language
+        in place instead of creating a duplicate.
         """
-        # Update the 'am' translation
-        self.instance.set_lisan('am', title="Updated Title")
+        original = self.instance.get_lisan('am')
 
-        # Retrieve the updated translation
-        lisan = self.instance.get_lisan('am')
+        # One upsert, then one query reading the stored row back
+        with self.assertNumQueries(2):
+            returned = self.instance.set_lisan('am', title="Updated Title")
+        self.assertEqual(returned.pk, original.pk)
+        self.assertEqual(returned.description, "ምሳሌ መግለጫ")
+
+        # The returned row is cached for later lookups
+        with self.assertNumQueries(0):
+            self.assertIs(self.instance.get_lisan('am'), returned)
 
-        # Verify the translation was updated
+        lisan = self.instance.get_lisan('am')
+        self.assertEqual(lisan.pk, original.pk)
         self.assertEqual(lisan.title, "Updated Title")
         self.assertEqual(lisan.description, "ምሳሌ መግለጫ")  # Unchanged field
-
-        # Verify that no duplicate translations exist
-        am_translations_count = self.instance.Lisan.objects.filter(
-            language_code='am').count()
-        self.assertEqual(am_translations_count, 1)
+        self.assertEqual(
+            list(self.instance.Lisan.objects.filter(
+                language_code='am').values_list('pk', flat=True)),
+            [original.pk])
 
     def test_set_lisan_creates_new_translation(self):
         """
@@ -266,7 +538,9 @@ class TestLisanModelMixin(TestCase):
                 "description": "ምሳሌ መግለጫ"
             }
         ]
-        self.instance.set_bulk_lisans(translations)
+        # Updating 'am' and creating 'or' takes a single upsert
+        with self.assertNumQueries(1):
+            self.instance.set_bulk_lisans(translations)
 
         # Verify the 'am' translation was updated
         am_translation = self.instance.get_lisan('am')
@@ -279,10 +553,9 @@ class TestLisanModelMixin(TestCase):
         self.assertEqual(or_translation.title, "Nagaa Addunyaa")
         self.assertEqual(or_translation.description, "Fakkeenya")
 
-        # Verify that no duplicates exist
-        am_translations_count = self.instance.Lisan.objects.filter(
-            language_code='am').count()
-        or_translations_count = self.instance.Lisan.objects.filter(
-            language_code='or').count()
-        self.assertEqual(am_translations_count, 1)
-        self.assertEqual(or_translations_count, 1)
+        # Verify that no duplicates exist, with a single query
+        with self.assertNumQueries(1):
+            language_codes = sorted(self.instance.Lisan.objects.filter(
+                language_code__in=['am', 'or']
+            ).values_list('language_code', flat=True))
+        self.assertEqual(language_codes, ['am', 'or'])
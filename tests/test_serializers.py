@@ -1,48 +1,69 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from rest_framework.test import APIRequestFactory
 from rest_framework.exceptions import ValidationError
 from tests.models import TestModel
 from lisan.serializers import TranslationSerializer, LisanSerializerMixin
 
+# Holds no per-request state, so it is shared by all the tests
+_FACTORY = APIRequestFactory()
 
-class TestTranslationSerializer(TestCase):
+
+class TestModelSerializer(LisanSerializerMixin):
+    # Defined once, as building a serializer class runs DRF's metaclass
+    class Meta:
+        model = TestModel
+        fields = ['id', 'title', 'description', 'author']
+
+
+class TestTranslationSerializer(SimpleTestCase):
     """
     Test suite for the TranslationSerializer class.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Build the serializer once; validating or representing data does not
+        change it.
+        """
+        super().setUpClass()
+        cls.serializer = TranslationSerializer(
+            lisan_fields=['title', 'description'])
+
     def test_dynamic_fields(self):
         """
         Test that TranslationSerializer dynamically adds fields based on
         `lisan_fields`.
         """
-        serializer = TranslationSerializer(
-            lisan_fields=['title', 'description'])
-        self.assertIn('title', serializer.fields)
-        self.assertIn('description', serializer.fields)
-        self.assertIn('language_code', serializer.fields)
+        self.assertIn('title', self.serializer.fields)
+        self.assertIn('description', self.serializer.fields)
+        self.assertIn('language_code', self.serializer.fields)
 
     def test_serialize_translation(self):
         """
         Test serialization of translation data.
         """
         data = {'language_code': 'am', 'title': 'ሰላም', 'description': 'ምሳሌ'}
-        serializer = TranslationSerializer(
-            lisan_fields=['title', 'description'], data=data)
-        self.assertTrue(serializer.is_valid())
-        self.assertEqual(serializer.validated_data, data)
+        self.assertEqual(self.serializer.run_validation(data), data)
+
+    def test_serialize_translation_invalid(self):
+        """
+        Test that translation data without a language code is rejected.
+        """
+        with self.assertRaises(ValidationError) as context:
+            self.serializer.run_validation({'title': 'ሰላም'})
+        self.assertIn('language_code', context.exception.detail)
 
     def test_deserialize_translation(self):
         """
         Test deserialization of translation data.
         """
-        serializer = TranslationSerializer(
-            lisan_fields=['title', 'description'])
-        instance = serializer.to_representation({
+        instance = self.serializer.to_representation({
             'language_code': 'am', 'title': 'ሰላም', 'description': 'ምሳሌ'
         })
-        self.assertEqual(instance['language_code'], 'am')
-        self.assertEqual(instance['title'], 'ሰላም')
-        self.assertEqual(instance['description'], 'ምሳሌ')
+        self.assertEqual(
+            instance,
+            {'language_code': 'am', 'title': 'ሰላም', 'description': 'ምሳሌ'})
 
 
 class TestLisanSerializerMixin(TestCase):
@@ -50,24 +71,24 @@ class TestLisanSerializerMixin(TestCase):
     Test suite for the LisanSerializerMixin class.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Set up the test environment with a mock request and model instance.
+        Create the model instance and its translation once for the class.
         """
-        self.factory = APIRequestFactory()
-        self.request = self.factory.get('/')
-        self.request.language_code = 'en'
-        self.model_instance = TestModel.objects.create(
+        cls.model_instance = TestModel.objects.create(
             title="Hello World",
             description="Sample description"
         )
-        self.model_instance.set_lisan('am', title="ሰላም", description="ምሳሌ")
-
-        class TestModelSerializer(LisanSerializerMixin):
-            class Meta:
-                model = TestModel
-                fields = ['id', 'title', 'description', 'author']
+        cls.model_instance.set_lisan('am', title="ሰላም", description="ምሳሌ")
 
+    def setUp(self):
+        """
+        Set up the test environment with a mock request.
+        """
+        self.factory = _FACTORY
+        self.request = self.factory.get('/')
+        self.request.language_code = 'en'
         self.serializer_class = TestModelSerializer
 
     def test_representation(self):
@@ -91,6 +112,67 @@ class TestLisanSerializerMixin(TestCase):
         self.assertEqual(translations[1]['title'], "ሰላም")
         self.assertEqual(translations[1]['description'], "ምሳሌ")
 
+    def test_representation_single_query(self):
+        """
+        Test that an instance loaded without `setup_eager_loading` gets all
+        its translations with a single query.
+        """
+        serializer = self.serializer_class(
+            self.model_instance, context={'request': self.request})
+        with self.assertNumQueries(1):
+            representation = serializer.data
+        self.assertEqual(representation['translations'][1]['title'], "ሰላም")
+
+    def test_representation_does_not_keep_prefetch(self):
+        """
+        Test that serializing an instance does not leave the translations
+        loaded for the representation on it.
+        """
+        self.model_instance.set_lisan('or', title="Nagaa")
+        instance = TestModel.objects.get(pk=self.model_instance.pk)
+
+        with override_settings(LISAN_ALLOWED_LANGUAGES=['en', 'am']):
+            self.serializer_class(
+                instance, context={'request': self.request}).data
+
+        self.assertNotIn('_prefetched_lisans', instance.__dict__)
+        # A language that was not rendered is still queried
+        with self.assertNumQueries(1):
+            self.assertEqual(instance.get_lisan('or').title, "Nagaa")
+
+    def test_setup_eager_loading(self):
+        """
+        Test that prefetching translations lets a list of objects be
+        serialized without one query per object, field and language.
+        """
+        other_instance = TestModel.objects.create(
+            title="Second", description="Second description")
+        other_instance.set_lisan('tg', title="Дуюм")
+
+        queryset = self.serializer_class.setup_eager_loading(
+            TestModel.objects.order_by('pk'))
+        with self.assertNumQueries(2):
+            data = self.serializer_class(
+                queryset, many=True, context={'request': self.request}).data
+
+        self.assertEqual(data[0]['translations'][1]['title'], "ሰላም")
+        self.assertEqual(data[1]['translations'][3]['title'], "Дуюм")
+
+    def test_setup_eager_loading_skips_unused_languages(self):
+        """
+        Test that translations in languages that cannot be rendered are
+        not prefetched.
+        """
+        self.model_instance.set_lisan('or', title="Nagaa")
+
+        with override_settings(LISAN_ALLOWED_LANGUAGES=['en', 'am']):
+            instance = self.serializer_class.setup_eager_loading(
+                TestModel.objects.filter(pk=self.model_instance.pk)).get()
+
+        self.assertEqual(
+            [lisan.language_code for lisan in instance._prefetched_lisans],
+            ['am'])
+
     def test_create_with_translations(self):
         """
         Test creating a model instance with translations.
@@ -126,7 +208,9 @@ class TestLisanSerializerMixin(TestCase):
             data=data, context={'request': self.request})
         self.assertTrue(serializer.is_valid())
 
-        instance = serializer.save()
+        # One INSERT for the instance and one for all its translations
+        with self.assertNumQueries(2):
+            instance = serializer.save()
         self.assertEqual(instance.title, "New Title")
         self.assertEqual(instance.get_lisan_field('title', 'am'), "አስደሳች ጉዞ")
         self.assertEqual(instance.get_lisan_field(
@@ -152,6 +236,32 @@ class TestLisanSerializerMixin(TestCase):
         self.assertEqual(instance.title, "Updated Title")
         self.assertEqual(instance.get_lisan_field('title', 'am'), "አዲስ ሰላም")
 
+    def test_update_translations_single_bulk_write(self):
+        """
+        Test that the synchronized and given translations are written
+        with a constant number of queries.
+        """
+        self.request.method = 'PATCH'
+        data = {
+            'title': "Updated Title",
+            'translations': [
+                {'language_code': 'am', 'title': "አዲስ ሰላም"},
+                {'language_code': 'or', 'title': "Nagaa"},
+                {'language_code': 'tg', 'title': "ሰላም"}
+            ]
+        }
+        serializer = self.serializer_class(
+            self.model_instance, data=data,
+            partial=True, context={'request': self.request})
+        self.assertTrue(serializer.is_valid())
+
+        # UPDATE of the instance, then one upsert for the translations
+        with self.assertNumQueries(2):
+            instance = serializer.save()
+        self.assertEqual(instance.get_lisan_field('title', 'en'),
+                         "Updated Title")
+        self.assertEqual(instance.get_lisan_field('title', 'tg'), "ሰላም")
+
     def test_validation_missing_translations(self):
         """
         Test validation error for missing translations.
@@ -160,8 +270,8 @@ class TestLisanSerializerMixin(TestCase):
         data = {'title': "New Title"}
         serializer = self.serializer_class(
             data=data, context={'request': self.request})
+        self.assertTrue(serializer.is_valid())
         with self.assertRaises(ValidationError):
-            serializer.is_valid(raise_exception=True)
             serializer.save()
 
     def test_validation_unsupported_language(self):
@@ -177,8 +287,9 @@ class TestLisanSerializerMixin(TestCase):
         }
         serializer = self.serializer_class(
             data=data, context={'request': self.request})
-        with self.assertRaises(ValidationError):
-            serializer.is_valid(raise_exception=True)
+        self.assertTrue(serializer.is_valid())
+        # The translations are checked before anything is written
+        with self.assertNumQueries(0), self.assertRaises(ValidationError):
             serializer.save()
 
     def test_dynamic_fields_removal(self):
@@ -194,10 +305,11 @@ class TestLisanSerializerMixin(TestCase):
         Test that the `translations` field is added for write methods.
         """
         for method in ['POST', 'PUT', 'PATCH']:
-            self.request.method = method
-            serializer = self.serializer_class(
-                context={'request': self.request})
-            self.assertIn('translations', serializer.fields)
+            with self.subTest(method=method):
+                self.request.method = method
+                serializer = self.serializer_class(
+                    context={'request': self.request})
+                self.assertIn('translations', serializer.fields)
 
     def test_representation_unsupported_language(self):
         """
@@ -243,8 +355,8 @@ class TestLisanSerializerMixin(TestCase):
         data = {'translations': [{'language_code': 'am'}]}
         serializer = self.serializer_class(
             data=data, context={'request': self.request})
+        self.assertTrue(serializer.is_valid())
         with self.assertRaises(ValidationError):
-            serializer.is_valid(raise_exception=True)
             serializer.save()
 
     def test_update_with_unsupported_language(self):
@@ -261,8 +373,8 @@ class TestLisanSerializerMixin(TestCase):
             self.model_instance, data=data,
             partial=True, context={'request': self.request})
 
+        self.assertTrue(serializer.is_valid())
         with self.assertRaises(ValidationError) as context:
-            serializer.is_valid(raise_exception=True)
             serializer.save()
 
         self.assertIn("Unsupported language code", str(context.exception))
@@ -292,6 +404,31 @@ class TestLisanSerializerMixin(TestCase):
         # Unchanged
         self.assertEqual(instance.get_lisan_field('description', 'am'), "ምሳሌ")
 
+    def test_translation_serializer_class_shared(self):
+        """
+        Test that serializers reuse the same translation serializer class,
+        declaring the translatable fields.
+        """
+        self.request.method = 'POST'
+        first = self.serializer_class(context={'request': self.request})
+        second = self.serializer_class(context={'request': self.request})
+
+        first_child = first.fields['translations'].child
+        second_child = second.fields['translations'].child
+        self.assertIs(type(first_child), type(second_child))
+        self.assertIn('title', type(first_child)._declared_fields)
+        self.assertIsNot(
+            first_child.fields['title'], second_child.fields['title'])
+
+    def test_fields_built_lazily(self):
+        """
+        Test that instantiating the serializer does not build its fields.
+        """
+        self.request.method = 'POST'
+        serializer = self.serializer_class(context={'request': self.request})
+        self.assertNotIn('fields', serializer.__dict__)
+        self.assertIn('translations', serializer.fields)
+
     def test_handle_dynamic_fields_add_translations(self):
         """
         Test that `_handle_dynamic_fields` dynamically adds the `translations`
@@ -342,14 +479,9 @@ class TestLisanSerializerMixin(TestCase):
         }
         serializer = self.serializer_class(
             data=data, context={'request': self.request})
+        self.assertTrue(serializer.is_valid())
         with self.assertRaises(ValidationError):
-            serializer.is_valid(raise_exception=True)
-            instance = serializer.save()
-            # Ensure it defaults to the default language ('en')
-            self.assertEqual(
-                instance.get_lisan_field('title', 'or'),
-                "Unsupported Language Test")
-            self.request.language_code = None
+            serializer.save()
 
     def test_validate_translations_empty_partial(self):
         """
@@ -383,22 +515,28 @@ class TestLisanSerializerMixin(TestCase):
             "Missing translations for languages",
             str(context.exception.detail[0]))
 
+    def _partial_update(self, data):
+        """
+        Apply `data` to the model instance with a PATCH request and return
+        the saved instance.
+        """
+        self.request.method = 'PATCH'
+        serializer = self.serializer_class(
+            self.model_instance, data=data,
+            partial=True, context={'request': self.request})
+        self.assertTrue(serializer.is_valid())
+        return serializer.save()
+
     def test_update_sync_translatable_fields(self):
         """
         Test that updating translatable fields in the main model synchronizes
         changes to the default language translation.
         """
-        self.request.method = 'PATCH'
         data = {
             'title': "Updated Title",
             'description': "Updated Description"
         }
-        serializer = self.serializer_class(
-            self.model_instance, data=data,
-            partial=True, context={'request': self.request})
-        self.assertTrue(serializer.is_valid())
-
-        instance = serializer.save()
+        instance = self._partial_update(data)
 
         # Check that the main model fields are updated
         self.assertEqual(instance.title, "Updated Title")
@@ -414,18 +552,12 @@ class TestLisanSerializerMixin(TestCase):
         Test that updating translatable fields synchronizes changes to the
         specified language translation when the language code is set.
         """
-        self.request.method = 'PATCH'
         self.request.language_code = 'am'
         data = {
             'title': "አዲስ ርእስ",
             'description': "አዲስ መግለጫ"
         }
-        serializer = self.serializer_class(
-            self.model_instance, data=data,
-            partial=True, context={'request': self.request})
-        self.assertTrue(serializer.is_valid())
-
-        instance = serializer.save()
+        instance = self._partial_update(data)
 
         # Check that the main model fields are updated
         self.assertEqual(instance.title, "አዲስ ርእስ")
@@ -441,14 +573,10 @@ class TestLisanSerializerMixin(TestCase):
         Test that updating non-translatable fields does not affect
         translations.
         """
-        self.request.method = 'PATCH'
         data = {'author': "New Author"}
-        serializer = self.serializer_class(
-            self.model_instance, data=data,
-            partial=True, context={'request': self.request})
-        self.assertTrue(serializer.is_valid())
-
-        instance = serializer.save()
+        # Only the main model is written
+        with self.assertNumQueries(1):
+            instance = self._partial_update(data)
 
         # Check that the main model field is updated
         self.assertEqual(instance.author, "New Author")
@@ -463,17 +591,11 @@ class TestLisanSerializerMixin(TestCase):
         Test that updating both translatable and non-translatable fields
         synchronizes translatable fields while updating the main model.
         """
-        self.request.method = 'PATCH'
         data = {
             'title': "Updated Title",
             'author': "New Author"
         }
-        serializer = self.serializer_class(
-            self.model_instance, data=data,
-            partial=True, context={'request': self.request})
-        self.assertTrue(serializer.is_valid())
-
-        instance = serializer.save()
+        instance = self._partial_update(data)
 
         # Check that both main model fields are updated
         self.assertEqual(instance.title, "Updated Title")
@@ -489,17 +611,11 @@ class TestLisanSerializerMixin(TestCase):
         Test that updating with an unsupported language defaults to the
         default language for synchronization.
         """
-        self.request.method = 'PATCH'
         self.request.language_code = 'unsupported'
         data = {
             'title': "Unsupported Language Title"
         }
-        serializer = self.serializer_class(
-            self.model_instance, data=data,
-            partial=True, context={'request': self.request})
-        self.assertTrue(serializer.is_valid())
-
-        instance = serializer.save()
+        instance = self._partial_update(data)
 
         # Check that the default language is used for synchronization
         lisan = instance.get_lisan('en')